@@ -79,6 +79,11 @@ def load_user(user_id):
     
     return None
 
+# Traded coin universes - constants built once at import instead of being
+# rebuilt inside every config save/default
+USDT_COINS = ('btc', 'eth', 'xrp', 'ada', 'dot', 'xlm', 'imx', 'doge', 'inj', 'ldo', 'arb', 'uni', 'sol', 'bnb', 'fet')
+USDC_COINS = ('btcusdc', 'ethusdc', 'solusdc', 'aaveusdc', 'bchusdc', 'xrpusdc', 'adausdc', 'avaxusdc', 'linkusdc', 'arbusdc', 'uniusdc', 'crvusdc', 'tiausdc', 'bnbusdc', 'filusdc')
+
 # Binance handler instance
 binance_handler = None
 
@@ -128,9 +133,7 @@ def load_config():
                             config_data = create_default_config()
                             save_config_with_backup(config_data)
     except Exception as e:
-        logger.error(f"Error loading config: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.error(f"Error loading config: {str(e)}", exc_info=True)
         config_data = create_default_config()
         try:
             save_config_with_backup(config_data)
@@ -140,11 +143,21 @@ def load_config():
     global binance_handler
     if config_data.get('binance_api_key') and config_data.get('binance_secret_key'):
         try:
-            binance_handler = BinanceHandler(
-                config_data['binance_api_key'],
-                config_data['binance_secret_key'],
-                config_data
-            )
+            # Keep the handler long-lived: rebuilding it on every request would
+            # tear down its websocket streams, caches and worker threads
+            if (binance_handler is None
+                    or binance_handler.api_key != config_data['binance_api_key']
+                    or binance_handler.secret_key != config_data['binance_secret_key']
+                    or binance_handler.config != config_data):
+                previous_handler = binance_handler
+                binance_handler = BinanceHandler(
+                    config_data['binance_api_key'],
+                    config_data['binance_secret_key'],
+                    config_data
+                )
+                # Release the replaced handler's sockets and threads
+                if previous_handler is not None:
+                    previous_handler.close()
         except Exception as handler_err:
             logger.error(f"Failed to initialize BinanceHandler: {str(handler_err)}")
     
@@ -172,8 +185,7 @@ def create_default_config():
     }
     
     # USDT coins
-    usdt_coins = ['btc', 'eth', 'xrp', 'ada', 'dot', 'xlm', 'imx', 'doge', 'inj', 'ldo', 'arb', 'uni', 'sol', 'bnb', 'fet']
-    for coin in usdt_coins:
+    for coin in USDT_COINS:
         config[f'{coin}_atr_period'] = 14
         config[f'{coin}_atr_tp_multiplier'] = 2.5
         config[f'{coin}_atr_sl_multiplier'] = 3.0
@@ -183,8 +195,7 @@ def create_default_config():
         config[f'{coin}_product_type'] = 'USDT-FUTURES'
     
     # USDC coins
-    usdc_coins = ['btcusdc', 'ethusdc', 'solusdc', 'aaveusdc', 'bchusdc', 'xrpusdc', 'adausdc', 'avaxusdc', 'linkusdc', 'arbusdc', 'uniusdc', 'crvusdc', 'tiausdc', 'bnbusdc', 'filusdc']
-    for coin in usdc_coins:
+    for coin in USDC_COINS:
         config[f'{coin}_atr_period'] = 14
         config[f'{coin}_atr_tp_multiplier'] = 2.5
         config[f'{coin}_atr_sl_multiplier'] = 3.0
@@ -368,9 +379,14 @@ def dashboard():
             if api_positions:
                 positions = binance_handler.update_dashboard_positions(api_positions)
             
-            # Get balances
-            usdt_balance, usdt_equity, usdt_unrealized_pnl = binance_handler.get_account_balance('USDT')
-            usdc_balance, usdc_equity, usdc_unrealized_pnl = binance_handler.get_account_balance('USDC')
+            # Get balances (one shared futures_account fetch for both assets)
+            try:
+                account_info = binance_handler.client.futures_account()
+            except Exception as acct_err:
+                logger.error(f"Failed to fetch futures account: {str(acct_err)}")
+                account_info = None
+            usdt_balance, usdt_equity, usdt_unrealized_pnl = binance_handler.get_account_balance('USDT', account_info=account_info)
+            usdc_balance, usdc_equity, usdc_unrealized_pnl = binance_handler.get_account_balance('USDC', account_info=account_info)
             
         except Exception as e:
             logger.error(f"Dashboard error: {str(e)}")
@@ -447,8 +463,7 @@ def settings():
         }
         
         # USDT coins
-        usdt_coins = ['btc', 'eth', 'xrp', 'ada', 'dot', 'xlm', 'imx', 'doge', 'inj', 'ldo', 'arb', 'uni', 'sol', 'bnb', 'fet']
-        for coin in usdt_coins:
+        for coin in USDT_COINS:
             updated_config[f'{coin}_atr_period'] = int(request.form.get(f'{coin}_atr_period', 14))
             updated_config[f'{coin}_atr_tp_multiplier'] = float(request.form.get(f'{coin}_atr_tp_multiplier', 2.5))
             updated_config[f'{coin}_atr_sl_multiplier'] = float(request.form.get(f'{coin}_atr_sl_multiplier', 3.0))
@@ -458,8 +473,7 @@ def settings():
             updated_config[f'{coin}_product_type'] = 'USDT-FUTURES'
         
         # USDC coins
-        usdc_coins = ['btcusdc', 'ethusdc', 'solusdc', 'aaveusdc', 'bchusdc', 'xrpusdc', 'adausdc', 'avaxusdc', 'linkusdc', 'arbusdc', 'uniusdc', 'crvusdc', 'tiausdc', 'bnbusdc', 'filusdc']
-        for coin in usdc_coins:
+        for coin in USDC_COINS:
             updated_config[f'{coin}_atr_period'] = int(request.form.get(f'{coin}_atr_period', 14))
             updated_config[f'{coin}_atr_tp_multiplier'] = float(request.form.get(f'{coin}_atr_tp_multiplier', 2.5))
             updated_config[f'{coin}_atr_sl_multiplier'] = float(request.form.get(f'{coin}_atr_sl_multiplier', 3.0))
@@ -470,13 +484,16 @@ def settings():
         
         save_config_with_backup(updated_config)
         
-        # Reinitialize handler
+        # Reinitialize handler, releasing the old instance's resources
         global binance_handler
+        previous_handler = binance_handler
         binance_handler = BinanceHandler(
             updated_config['binance_api_key'],
             updated_config['binance_secret_key'],
             updated_config
         )
+        if previous_handler is not None:
+            previous_handler.close()
         
         flash('Settings updated successfully', 'success')
         return redirect(url_for('settings'))
@@ -684,26 +701,11 @@ def test_telegram():
         else:
             test_message = "🧪 TEST NOTIFICATION\n\nThis is a test message from Binance Trading Bot.\n\nIf you receive this, Telegram integration is working correctly!"
         
-        # Send notification
+        # Send notification on the handler's background loop instead of
+        # building a throwaway thread + event loop per test message
         try:
-            import asyncio
-            import threading
-            
-            def send_in_thread():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(binance_handler.send_telegram_notification(test_message))
-                    finally:
-                        loop.close()
-                except Exception as e:
-                    logger.error(f"Error in test notification thread: {str(e)}")
-            
-            thread = threading.Thread(target=send_in_thread, daemon=True)
-            thread.start()
-            thread.join(timeout=10)  # Wait max 10 seconds
-            
+            binance_handler.send_notification_threadsafe(test_message, timeout=10)
+
             return jsonify({
                 "status": "success",
                 "message": "Test notification sent",
@@ -714,9 +716,7 @@ def test_telegram():
             }), 200
             
         except Exception as e:
-            logger.error(f"Error sending test notification: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Error sending test notification: {str(e)}", exc_info=True)
             return jsonify({
                 "status": "error",
                 "message": f"Failed to send notification: {str(e)}",
@@ -1,12 +1,27 @@
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.adapters import HTTPAdapter
+import heapq
 import logging
+import math
+import re
 import time
+import threading
+from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 import asyncio
-import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional - the pure-Python recurrence below still works
+    njit = None
+
 # Import management systems
 from tp_sl_manager import TPSLManager
 from coin_config_manager import CoinConfigManager
@@ -14,6 +29,104 @@ from position_validator import PositionValidator
 
 logger = logging.getLogger(__name__)
 
+# Notification message templates, hoisted so the literals exist once instead
+# of being rebuilt inline in the notification path
+_MSG_HEADER = (
+    "🚀 NEW {direction} POSITION OPENED\n"
+    "💰 Symbol: {symbol}\n"
+    "📈 Entry Price: ${price:.2f}\n"
+    "📊 Quantity: {quantity:.6f}\n"
+    "🆔 Order ID: {order_id}\n"
+)
+_MSG_TPSL = (
+    "🎯 Take Profit: ${tp_price:.2f} (+{tp_pct:.1f}%)\n"
+    "🛡️ Stop Loss: ${sl_price:.2f} (-{sl_pct:.1f}%)\n"
+)
+
+
+@dataclass(slots=True)
+class PositionState:
+    """Compact typed snapshot of one tracked position
+
+    Slots keep per-position memory small and comparisons cheap compared to
+    retaining the full ~15-key Binance position dict every monitor tick.
+    """
+    symbol: str
+    side: str
+    amt: float
+    entry: float
+    mark: float
+    upnl: float
+    leverage: int
+    margin_type: str
+
+# Symbols we trade, built once at import instead of per get_position_history call
+_USDT_COINS = ('btc', 'eth', 'xrp', 'ada', 'dot', 'xlm', 'imx', 'doge', 'inj', 'ldo', 'arb', 'uni', 'sol', 'bnb', 'fet')
+_USDC_SYMBOLS = ('btcusdc', 'ethusdc', 'solusdc', 'aaveusdc', 'bchusdc', 'xrpusdc', 'adausdc', 'avaxusdc', 'linkusdc', 'arbusdc', 'uniusdc', 'crvusdc', 'tiausdc', 'bnbusdc', 'filusdc')
+_DEFAULT_SYMBOLS = tuple([f"{coin.upper()}USDT" for coin in _USDT_COINS] + [s.upper() for s in _USDC_SYMBOLS])
+
+# Percentage quantity strings like '10%' / '12.5 %' - one precompiled match
+# instead of endswith + rstrip + float per order
+_PCT_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*%\s*$')
+
+# Binance error codes that a retry can never fix (wrong endpoint, invalid
+# parameters, order would trigger immediately) - the trailing-stop retry loop
+# breaks straight to the fallback TP/SL on these instead of backing off
+_FATAL_ALGO_ERRORS = frozenset({-1102, -1106, -1111, -2021, -4120, -4136})
+
+# Direction-keyed constants for the trailing-stop strategy - collapses the
+# long/short branches scattered through the order path into data lookups
+_DIR_TABLE = {
+    'long': {
+        'position_side': 'LONG',
+        'close_side': 'SELL',
+        'activation_mult': 1.02,   # activation 2% above entry
+        'take_profit_mult': 1.05,  # fallback TP 5% above entry
+        'stop_loss_mult': 0.97,    # fallback SL 3% below entry
+    },
+    'short': {
+        'position_side': 'SHORT',
+        'close_side': 'BUY',
+        'activation_mult': 0.98,   # activation 2% below entry
+        'take_profit_mult': 0.95,  # fallback TP 5% below entry
+        'stop_loss_mult': 1.03,    # fallback SL 3% above entry
+    },
+}
+
+# Log banner built once - the hot order path emits it several times per order
+_BANNER = "=" * 80
+
+# Telegram rejects sendMessage payloads longer than 4096 characters
+_TG_MESSAGE_LIMIT = 4096
+
+# Margin asset by symbol suffix (branchless lookup, unknown suffixes fall back to USDT)
+_MARGIN_BY_SUFFIX = {'USDC': 'USDC', 'USDT': 'USDT', 'BUSD': 'BUSD'}
+
+def _wilder_atr(tr, period):
+    """Wilder ATR recurrence over a TR array (seeded like ewm(adjust=False))
+
+    The recurrence is inherently sequential and cannot vectorize; when numba
+    is installed this compiles to a tight native loop.
+
+    Args:
+        tr (np.ndarray): True Range values (float64)
+        period (int): ATR period
+
+    Returns:
+        float: Final smoothed ATR value
+    """
+    alpha = 1.0 / period
+    atr = tr[0]
+    for i in range(1, tr.shape[0]):
+        atr += (tr[i] - atr) * alpha
+    return atr
+
+if njit is not None:
+    # Explicit signature forces compilation at import (served from the numba
+    # disk cache on later runs) so the first ATR calculation never pays the
+    # JIT cold start on the order path
+    _wilder_atr = njit('float64(float64[:], int64)', cache=True, fastmath=True)(_wilder_atr)
+
 class BinanceHandler:
     """Handler class for Binance Futures API operations"""
     
@@ -34,11 +147,132 @@ class BinanceHandler:
         else:
             self.config = config
         
+        # Hot-path constants resolved once - config is fixed for the lifetime
+        # of this handler (app.py rebuilds it on settings changes), so these
+        # dict/attribute lookups don't need re-resolving per order
+        self._kline_interval_15m = Client.KLINE_INTERVAL_15MINUTE
+        self._enable_trading = bool(self.config.get('enable_trading', False))
+        self._auto_position_switch = bool(self.config.get('auto_position_switch', True))
+
         # Initialize Binance client
         self.client = Client(api_key, secret_key)
-        
+
+        # Mount a larger keep-alive connection pool on the client session so
+        # REST calls reuse TCP/TLS connections instead of re-handshaking.
+        # No adapter-level retries: re-sending an order POST after a lost
+        # response could double-fill a position.
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64)
+        self.client.session.mount('https://', adapter)
+        self.client.session.headers['Connection'] = 'keep-alive'
+
+        # Pre-warm a keep-alive connection in the background so the first
+        # order's pre-flight burst doesn't pay the TCP/TLS handshake
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+
         # Store last known position states
         self.last_position_states = {}
+
+        # Shared mark-price cache (all symbols, refreshed at most once per second)
+        self._price_cache = {}
+        self._price_cache_ts = 0.0
+
+        # Per-asset balance snapshots: asset -> (available, total, upnl, ts).
+        # 2s TTL, cleared on every fill so post-order reads are always fresh
+        self._balance_cache = {}
+
+        # Parsed LOT_SIZE filters per symbol from futures_exchange_info
+        # (multi-hundred-KB payload - refreshed at most once per hour)
+        self._symbol_filters_cache = {}
+        self._symbol_filters_ts = 0.0
+
+        # Thread pool for firing independent REST calls concurrently
+        self._http_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='binance-http')
+
+        # Last-applied leverage / margin type per symbol - lets repeat orders
+        # skip the two settings round-trips when nothing changed
+        self._leverage_state = {}
+        self._margin_state = {}
+
+        # Account leverage per symbol for the get_open_positions backfill -
+        # 60s TTL, evicted early by ACCOUNT_CONFIG_UPDATE user-stream events
+        self._leverage_info = {}
+        self._leverage_info_ts = 0.0
+
+        # Cached dualSidePosition check - the mode only changes when the user
+        # flips it in the Binance UI, so don't re-fetch it on every order
+        self._position_mode_cache = None
+        self._position_mode_ts = 0.0
+
+        # Background event loop for fire-and-forget Telegram notifications
+        # (avoids spinning up a new loop and blocking the order path per message)
+        self._notif_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._notif_loop.run_forever, daemon=True).start()
+
+        # Coalescing queue: notification bursts are flushed as a single
+        # Telegram message every 500ms instead of one round-trip per event
+        # (the bot-level limit is ~30 msg/s, so bursts risk 429s)
+        self._notif_queue = asyncio.Queue()
+        asyncio.run_coroutine_threadsafe(self._notification_flush_loop(), self._notif_loop)
+
+        # Reusable Telegram Bot (lazy - built on first send) and the chat id
+        # normalized once instead of per message
+        self._tg_bot = None
+
+        # Token bucket for Telegram sends: ~1 msg/s refill with burst
+        # headroom of 5, matching the per-chat bot API limit
+        self._tg_tokens = 5.0
+        self._tg_tokens_ts = time.monotonic()
+
+        chat_id = self.config.get('telegram_chat_id') or ''
+        if chat_id.isdigit() and chat_id.startswith("100"):
+            chat_id = "-" + chat_id
+        self._tg_chat_id = chat_id
+
+        # Position snapshot cache invalidated by ACCOUNT_UPDATE events from the
+        # user-data websocket stream (started lazily on first positions call)
+        self._positions_cache = None
+        self._positions_cache_ts = 0.0
+        self._positions_dirty = True
+        self._positions_cache_lock = threading.Lock()
+        self._user_stream_started = False
+
+        # Entry fills delivered by ORDER_TRADE_UPDATE events - lets the order
+        # path read avgPrice from the stream instead of sleeping and polling
+        self._pending_fills = {}
+        self._recent_fills = {}
+
+        # Raw position rows indexed by symbol, cached for half a second so
+        # back-to-back lookups in the order path share one REST call
+        self._position_info_map = None
+        self._position_info_ts = 0.0
+
+        # Trade history cache, invalidated by ORDER_TRADE_UPDATE events -
+        # between fills there is nothing new for the 30 per-symbol queries
+        # to find, so the merged cache is served instead. Per-symbol fromId
+        # cursors mean refreshes only download trades newer than the last
+        # seen ID rather than the full window every time
+        self._trade_cache = []
+        self._last_trade_id = {}
+        self._history_cache_limit = 0
+        self._history_cache_ts = 0.0
+        self._history_dirty = True
+        self._history_prefetch_inflight = False
+        self._history_lock = threading.Lock()
+
+        # Incremental ATR state fed by the 15m kline websocket stream:
+        # (symbol, period) -> (atr, prev_close, updated_ts). Symbols are
+        # subscribed lazily after their first REST-computed ATR.
+        self._kline_ws_manager = None
+        self._ws_manager_lock = threading.Lock()
+        self._kline_subscriptions = set()
+        self._atr_state = {}
+        self._atr_lock = threading.Lock()
+
+        # Last mark price per symbol fed by the markPrice websocket stream:
+        # symbol -> (price, updated_ts). Actively traded symbols serve
+        # get_symbol_price straight from memory, no REST round-trip.
+        self._ws_mark_price = {}
+        self._mark_price_subscriptions = set()
         
         # Initialize management systems
         self.tp_sl_manager = TPSLManager(self.config)
@@ -51,19 +285,102 @@ class BinanceHandler:
         logger.info("   [OK] Position Validator - Prevents duplicate positions")
         logger.info("   [READY] All systems ready for Binance Futures trading")
         
-    def _format_symbol(self, symbol: str) -> str:
+    def close(self):
+        """Release network resources held by this handler
+
+        Stops the websocket manager, worker pool, notification loop and the
+        pooled HTTP session. Called when a settings change replaces the
+        handler so the old instance doesn't keep streams and threads alive.
         """
-        Format symbol for Binance API
-        
+        try:
+            if self._kline_ws_manager is not None:
+                self._kline_ws_manager.stop()
+        except Exception as e:
+            logger.warning(f"⚠️ Error stopping websocket manager: {str(e)}")
+        try:
+            self._http_pool.shutdown(wait=False)
+        except Exception:
+            pass
+        try:
+            self._notif_loop.call_soon_threadsafe(self._notif_loop.stop)
+        except Exception:
+            pass
+        try:
+            self.client.session.close()
+        except Exception:
+            pass
+
+    def _warm_connection(self):
+        """Open a pooled TLS connection to the futures API ahead of first use
+
+        Also measures clock skew once so signed requests carry a corrected
+        timestamp instead of risking recvWindow rejections on drifted hosts.
+        """
+        try:
+            self.client.futures_ping()
+            server_time = self.client.futures_time()['serverTime']
+            self.client.timestamp_offset = server_time - int(time.time() * 1000)
+        except Exception as e:
+            logger.debug("Connection pre-warm failed: %s", str(e))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _format_symbol(symbol: str) -> str:
+        """
+        Format symbol for Binance API (memoized - pure function of the symbol)
+
         Args:
             symbol (str): Trading symbol (e.g., 'BTCUSDT', 'ETHUSDC')
-            
+
         Returns:
             str: Formatted symbol (Binance uses plain format)
         """
         # Binance uses simple format like BTCUSDT, ETHUSDC
         return symbol.upper().strip()
     
+    def _get_symbol_filters(self, symbol: str):
+        """
+        Get the parsed LOT_SIZE filter for a symbol from the cached exchange info
+
+        The full futures_exchange_info payload is fetched at most once per hour
+        and parsed into a per-symbol dict in a single pass.
+
+        Args:
+            symbol (str): Trading symbol
+
+        Returns:
+            dict or None: {'step_size', 'min_qty', 'precision', 'tick_size',
+                'price_precision'} if known
+        """
+        now = time.time()
+        if not self._symbol_filters_cache or now - self._symbol_filters_ts > 3600:
+            exchange_info = self.client.futures_exchange_info()
+
+            cache = {}
+            for s in exchange_info['symbols']:
+                entry = {}
+                for filt in s['filters']:
+                    if filt['filterType'] == 'LOT_SIZE':
+                        # Decimal exponent handles padded strings
+                        # ('0.00100000' -> 3) and non-power-of-ten steps
+                        # ('0.5' -> 1) that a log10 round would misjudge
+                        entry['step_size'] = float(filt['stepSize'])
+                        entry['min_qty'] = float(filt.get('minQty', 0))
+                        entry['precision'] = max(
+                            0, -Decimal(filt['stepSize']).normalize().as_tuple().exponent)
+                    elif filt['filterType'] == 'PRICE_FILTER':
+                        entry['tick_size'] = float(filt['tickSize'])
+                        entry['price_precision'] = max(
+                            0, -Decimal(filt['tickSize']).normalize().as_tuple().exponent)
+                if entry:
+                    cache[s['symbol']] = entry
+
+            self._symbol_filters_cache = cache
+            self._symbol_filters_ts = now
+            logger.info("📐 Refreshed LOT_SIZE filters for %s symbols", len(cache))
+
+        return self._symbol_filters_cache.get(symbol.upper())
+
     def _format_quantity(self, symbol: str, quantity: float) -> float:
         """
         Format quantity according to Binance's precision requirements
@@ -76,47 +393,39 @@ class BinanceHandler:
             float: Formatted quantity with correct precision
         """
         try:
-            # Get exchange info for the symbol
-            exchange_info = self.client.futures_exchange_info()
-            
-            min_qty = None
-            step_size = None
-            precision = 3  # Default precision
-            
-            # Find the symbol in exchange info
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol.upper():
-                    # Find LOT_SIZE filter
-                    for filt in s['filters']:
-                        if filt['filterType'] == 'LOT_SIZE':
-                            step_size = float(filt['stepSize'])
-                            min_qty = float(filt.get('minQty', 0))
-                            
-                            # Calculate precision from stepSize
-                            # e.g., stepSize=0.001 -> precision=3
-                            precision = len(filt['stepSize'].rstrip('0').split('.')[-1]) if '.' in filt['stepSize'] else 0
-                            
-                            # Round quantity to stepSize
-                            rounded_qty = round(quantity / step_size) * step_size
-                            
-                            # Format to precision
-                            rounded_qty = round(rounded_qty, precision)
-                            
-                            logger.info(f"📐 Quantity precision: stepSize={step_size}, precision={precision}, minQty={min_qty}")
-                            logger.info(f"   Raw quantity: {quantity:.8f}, Rounded: {rounded_qty:.8f}")
-                            
-                            # Validate minimum quantity
-                            if min_qty and rounded_qty < min_qty:
-                                logger.error(f"❌ Quantity {rounded_qty:.8f} is below minimum {min_qty:.8f} for {symbol}")
-                                raise ValueError(f"Quantity {rounded_qty:.8f} is below minimum {min_qty:.8f} for {symbol}")
-                            
-                            # Validate that quantity is not zero or negative
-                            if rounded_qty <= 0:
-                                logger.error(f"❌ Quantity {rounded_qty:.8f} is zero or negative after formatting")
-                                raise ValueError(f"Quantity {rounded_qty:.8f} is zero or negative after formatting")
-                            
-                            return rounded_qty
-            
+            # O(1) lookup against the cached LOT_SIZE filters (one
+            # futures_exchange_info round-trip per hour instead of per order)
+            filters = self._get_symbol_filters(symbol)
+
+            if filters is not None and 'step_size' in filters:
+                step_size = filters['step_size']
+                min_qty = filters['min_qty']
+                precision = filters['precision']
+
+                # Floor quantity to stepSize - never round up past what the
+                # balance sizing allowed (and never past LOT_SIZE maxQty).
+                # The epsilon keeps exact multiples from losing a full step
+                # to float division (0.3 / 0.1 == 2.999... would floor to 2)
+                rounded_qty = math.floor(quantity / step_size + 1e-9) * step_size
+
+                # Format to precision
+                rounded_qty = round(rounded_qty, precision)
+
+                logger.debug("📐 Quantity precision: stepSize=%s, precision=%s, minQty=%s", step_size, precision, min_qty)
+                logger.debug("   Raw quantity: %.8f, Rounded: %.8f", quantity, rounded_qty)
+
+                # Validate minimum quantity
+                if min_qty and rounded_qty < min_qty:
+                    logger.error(f"❌ Quantity {rounded_qty:.8f} is below minimum {min_qty:.8f} for {symbol}")
+                    raise ValueError(f"Quantity {rounded_qty:.8f} is below minimum {min_qty:.8f} for {symbol}")
+
+                # Validate that quantity is not zero or negative
+                if rounded_qty <= 0:
+                    logger.error(f"❌ Quantity {rounded_qty:.8f} is zero or negative after formatting")
+                    raise ValueError(f"Quantity {rounded_qty:.8f} is zero or negative after formatting")
+
+                return rounded_qty
+
             # Fallback: round to 3 decimal places
             logger.warning(f"⚠️ Could not find LOT_SIZE filter for {symbol}, using default precision (3)")
             rounded_qty = round(quantity, 3)
@@ -141,6 +450,70 @@ class BinanceHandler:
             
             return rounded_qty
     
+    def _resolve_quantity(self, quantity_input, available_balance, current_price, coin_config):
+        """Resolve an order quantity from a webhook quantity field
+
+        Supports a percentage string ('10%'), an absolute value, or anything
+        invalid (falls back to the coin's order_size_percentage). Keeps the
+        balance/leverage sizing arithmetic in one place instead of repeating
+        it per input shape.
+
+        Args:
+            quantity_input: Raw quantity field ('10%', '0.5', 0.5 or None)
+            available_balance (float): Available margin balance
+            current_price (float): Current symbol price
+            coin_config (dict): Coin configuration (leverage, sizing defaults)
+
+        Returns:
+            tuple: (quantity, order_amount, leveraged_amount, percentage) -
+                the last three are None when an absolute quantity was given
+        """
+        pct_match = _PCT_RE.match(quantity_input) if isinstance(quantity_input, str) else None
+        if pct_match is not None:
+            percentage = float(pct_match.group(1))
+        else:
+            try:
+                return float(quantity_input), None, None, None
+            except (TypeError, ValueError):
+                # Default to coin config's order_size_percentage if invalid
+                percentage = coin_config.get('order_size_percentage', 10.0)
+                logger.warning("⚠️ Invalid quantity format '%s', using coin config: %s%%", quantity_input, percentage)
+
+        order_amount = available_balance * (percentage / 100)
+        leveraged_amount = order_amount * coin_config['leverage']
+        return leveraged_amount / current_price, order_amount, leveraged_amount, percentage
+
+    def _round_price_to_tick(self, symbol: str, price: float) -> float:
+        """
+        Snap a price to the symbol's PRICE_FILTER tickSize
+
+        Binance rejects stop prices that are not an increment of tickSize;
+        snapping against the cached exchange filters avoids that rejection
+        (and the retry round-trip) without hardcoded per-symbol steps.
+
+        Args:
+            symbol (str): Trading symbol
+            price (float): Price to round
+
+        Returns:
+            float: Price aligned to the symbol's tick size
+        """
+        try:
+            filters = self._get_symbol_filters(symbol)
+            if not filters or not filters.get('tick_size'):
+                # Unknown symbol - fall back to the static price-step table
+                return self.tp_sl_manager._round_to_price_step(symbol, price)
+
+            tick_size = filters['tick_size']
+            rounded_price = round(round(price / tick_size) * tick_size,
+                                  filters['price_precision'])
+
+            # Ensure we don't round to 0
+            return rounded_price if rounded_price > 0 else tick_size
+        except Exception as e:
+            logger.error(f"Error rounding price for {symbol}: {str(e)}")
+            return price
+
     def _get_margin_asset(self, symbol: str) -> str:
         """
         Determine margin asset from symbol
@@ -151,43 +524,53 @@ class BinanceHandler:
         Returns:
             str: Margin asset (USDT or USDC)
         """
-        if symbol.endswith('USDC'):
-            return 'USDC'
-        else:
-            return 'USDT'
+        return _MARGIN_BY_SUFFIX.get(symbol[-4:].upper(), 'USDT')
     
-    def get_account_balance(self, asset='USDT'):
+    def get_account_balance(self, asset='USDT', account_info=None):
         """Get Futures account balance
-        
+
         Args:
             asset (str): Asset symbol (USDT or USDC)
-            
+            account_info (dict, optional): Pre-fetched futures_account payload.
+                Pass it when checking several assets to avoid re-fetching the
+                same ~100KB response per asset.
+
         Returns:
             tuple: (available_balance, total_balance, unrealized_pnl)
         """
         try:
-            logger.info(f"[BALANCE] Fetching {asset} Futures balance...")
-            
-            # Get Futures account information
-            account_info = self.client.futures_account()
-            
+            # Short-lived cache: a strategy invocation checks the balance more
+            # than once within a couple of seconds - serve repeats from memory.
+            # The cache is dropped after every successful order placement.
+            if account_info is None:
+                cached = self._balance_cache.get(asset)
+                if cached is not None and time.time() - cached[3] < 2.0:
+                    return cached[:3]
+
+            logger.info("[BALANCE] Fetching %s Futures balance...", asset)
+
+            # Get Futures account information (unless the caller already has it)
+            if account_info is None:
+                account_info = self.client.futures_account()
+
             # Find the specific asset
             available = 0.0
             total = 0.0
             unrealized_pnl = 0.0
-            
+
             for asset_info in account_info['assets']:
                 if asset_info['asset'] == asset:
                     available = float(asset_info['availableBalance'])
                     total = float(asset_info['walletBalance'])
                     unrealized_pnl = float(asset_info['unrealizedProfit'])
                     break
-            
-            logger.info(f"[BALANCE] {asset} - Available: {available}, Total: {total}, Unrealized PnL: {unrealized_pnl}")
+
+            logger.info("[BALANCE] %s - Available: %s, Total: %s, Unrealized PnL: %s", asset, available, total, unrealized_pnl)
+            self._balance_cache[asset] = (available, total, unrealized_pnl, time.time())
             return available, total, unrealized_pnl
-            
+
         except Exception as e:
-            logger.error(f"Failed to get {asset} account balance: {str(e)}")
+            logger.error("Failed to get %s account balance: %s", asset, str(e))
             return 0.0, 0.0, 0.0
     
     def get_symbol_price(self, symbol):
@@ -201,18 +584,57 @@ class BinanceHandler:
         """
         try:
             formatted_symbol = self._format_symbol(symbol)
-            logger.info(f"Getting price for {formatted_symbol}")
-            
-            ticker = self.client.futures_symbol_ticker(symbol=formatted_symbol)
-            price = float(ticker['price'])
-            
-            logger.info(f"Current price for {formatted_symbol}: ${price:.2f}")
+            logger.info("Getting price for %s", formatted_symbol)
+
+            now = time.time()
+
+            # Warm path: mark price maintained by the websocket stream - no
+            # network at all for symbols that have been traded recently
+            ws_entry = self._ws_mark_price.get(formatted_symbol)
+            if ws_entry is not None and now - ws_entry[1] < 2.0:
+                price = ws_entry[0]
+                logger.info("Current price for %s: $%.2f (stream)", formatted_symbol, price)
+                return price
+
+            # Subscribe lazily so the next lookup for this symbol is served
+            # from the stream instead of REST
+            self._ensure_mark_price_stream(formatted_symbol)
+
+            # One batched futures_mark_price() call returns every symbol at once,
+            # so N price lookups inside a refresh window cost a single round-trip
+            if not self._price_cache or now - self._price_cache_ts >= 1.0:
+                tickers = self.client.futures_mark_price()
+                self._price_cache = {t['symbol']: float(t['markPrice']) for t in tickers}
+                self._price_cache_ts = now
+
+            price = self._price_cache.get(formatted_symbol, 0.0)
+
+            logger.info("Current price for %s: $%.2f", formatted_symbol, price)
             return price
             
         except Exception as e:
-            logger.error(f"Failed to get symbol price for {symbol}: {str(e)}")
+            logger.error("Failed to get symbol price for %s: %s", symbol, str(e))
             return 0.0
-    
+
+    def get_symbol_prices_batch(self, symbols):
+        """Get current prices for several symbols with a single REST call
+
+        The underlying futures_mark_price() call already returns every
+        symbol, so any number of lookups inside the cache window amortize
+        to one round-trip.
+
+        Args:
+            symbols (list): Trading pair symbols
+
+        Returns:
+            dict: {formatted_symbol: price} - missing symbols map to 0.0
+        """
+        prices = {}
+        for symbol in symbols:
+            formatted_symbol = self._format_symbol(symbol)
+            prices[formatted_symbol] = self.get_symbol_price(formatted_symbol)
+        return prices
+
     def set_leverage(self, symbol, leverage):
         """Set leverage for symbol
         
@@ -229,10 +651,10 @@ class BinanceHandler:
                 symbol=formatted_symbol,
                 leverage=leverage
             )
-            logger.info(f"✅ Leverage set to {leverage}x for {formatted_symbol}")
+            logger.info("✅ Leverage set to %sx for %s", leverage, formatted_symbol)
             return response
         except Exception as e:
-            logger.error(f"Failed to set leverage for {symbol}: {str(e)}")
+            logger.error("Failed to set leverage for %s: %s", symbol, str(e))
             return None
     
     def set_margin_type(self, symbol, margin_type='CROSSED'):
@@ -251,76 +673,432 @@ class BinanceHandler:
                 symbol=formatted_symbol,
                 marginType=margin_type
             )
-            logger.info(f"✅ Margin type set to {margin_type} for {formatted_symbol}")
+            logger.info("✅ Margin type set to %s for %s", margin_type, formatted_symbol)
             return response
         except BinanceAPIException as e:
             # Error code -4046 means margin type is already set
             if e.code == -4046:
-                logger.info(f"Margin type already set to {margin_type} for {formatted_symbol}")
+                logger.info("Margin type already set to %s for %s", margin_type, formatted_symbol)
                 return {'status': 'already_set'}
             else:
-                logger.error(f"Failed to set margin type for {symbol}: {str(e)}")
+                logger.error("Failed to set margin type for %s: %s", symbol, str(e))
                 return None
     
+    def _is_one_way_mode(self):
+        """Check whether the account is in one-way position mode (cached)
+
+        A 5-minute TTL removes the per-order futures_get_position_mode
+        round-trip while still picking up a mode flip made in the Binance UI
+        reasonably quickly.
+
+        Returns:
+            bool: True for ONE-WAY mode, False for HEDGE mode
+        """
+        now = time.time()
+        if self._position_mode_cache is None or now - self._position_mode_ts > 300:
+            position_mode = self.client.futures_get_position_mode()
+            self._position_mode_cache = not position_mode.get('dualSidePosition', False)
+            self._position_mode_ts = now
+        return self._position_mode_cache
+
+    def _ensure_ws_manager(self):
+        """Create and start the shared websocket manager (locked, once)
+
+        All streams (klines, mark price, user data) share one
+        ThreadedWebsocketManager. Creation is guarded by a lock because the
+        first order can race a pool thread against the webhook thread; an
+        unlocked check-then-act would leak the losing manager's event loop.
+
+        Returns:
+            ThreadedWebsocketManager: The running shared manager
+        """
+        with self._ws_manager_lock:
+            if self._kline_ws_manager is None:
+                from binance import ThreadedWebsocketManager
+                manager = ThreadedWebsocketManager(
+                    api_key=self.api_key, api_secret=self.secret_key
+                )
+                manager.start()
+                self._kline_ws_manager = manager
+            return self._kline_ws_manager
+
+    def _ensure_kline_stream(self, symbol):
+        """Subscribe to the 15m kline websocket stream for a symbol (lazy, once per symbol)
+
+        Args:
+            symbol (str): Formatted trading symbol
+        """
+        try:
+            if symbol in self._kline_subscriptions:
+                return
+
+            ws_manager = self._ensure_ws_manager()
+
+            self._kline_subscriptions.add(symbol)
+            ws_manager.start_kline_futures_socket(
+                callback=self._handle_kline_event,
+                symbol=symbol,
+                interval='15m'
+            )
+            logger.info("📡 Subscribed to 15m kline stream for %s", symbol)
+        except Exception as e:
+            # Stream is an optimization only - REST fallback still works
+            self._kline_subscriptions.discard(symbol)
+            logger.warning(f"⚠️ Could not subscribe to kline stream for {symbol}: {str(e)}")
+
+    def _handle_kline_event(self, msg):
+        """Update incremental ATR state from a closed websocket kline
+
+        Args:
+            msg (dict): Kline event from the websocket stream
+        """
+        try:
+            data = msg.get('data', msg)
+            kline = data.get('k')
+            if not kline or not kline.get('x'):  # only act on closed candles
+                return
+
+            symbol = kline['s']
+            high = float(kline['h'])
+            low = float(kline['l'])
+            close = float(kline['c'])
+
+            with self._atr_lock:
+                for key, (atr, prev_close, _) in list(self._atr_state.items()):
+                    state_symbol, period = key
+                    if state_symbol != symbol:
+                        continue
+                    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+                    # Wilder recurrence: same as ewm(alpha=1/period, adjust=False)
+                    new_atr = (atr * (period - 1) + tr) / period
+                    self._atr_state[key] = (new_atr, close, time.time())
+        except Exception as e:
+            logger.warning(f"⚠️ Kline stream update failed: {str(e)}")
+
+    def _ensure_mark_price_stream(self, symbol):
+        """Subscribe to the markPrice websocket stream for a symbol (lazy, once per symbol)
+
+        Args:
+            symbol (str): Formatted trading symbol
+        """
+        try:
+            if symbol in self._mark_price_subscriptions:
+                return
+
+            ws_manager = self._ensure_ws_manager()
+
+            self._mark_price_subscriptions.add(symbol)
+            ws_manager.start_symbol_mark_price_socket(
+                callback=self._handle_mark_price_event,
+                symbol=symbol
+            )
+            logger.info("📡 Subscribed to mark price stream for %s", symbol)
+        except Exception as e:
+            # Stream is an optimization only - REST fallback still works
+            self._mark_price_subscriptions.discard(symbol)
+            logger.warning(f"⚠️ Could not subscribe to mark price stream for {symbol}: {str(e)}")
+
+    def _handle_mark_price_event(self, msg):
+        """Store the latest websocket mark price for a symbol
+
+        Args:
+            msg (dict): markPriceUpdate event from the websocket stream
+        """
+        try:
+            data = msg.get('data', msg)
+            if data.get('e') == 'markPriceUpdate':
+                self._ws_mark_price[data['s']] = (float(data['p']), time.time())
+        except Exception as e:
+            logger.warning(f"⚠️ Mark price stream update failed: {str(e)}")
+
+    def _ensure_user_stream(self):
+        """Start the futures user-data websocket stream (lazy, once per handler)"""
+        if self._user_stream_started:
+            return
+        try:
+            ws_manager = self._ensure_ws_manager()
+            ws_manager.start_futures_user_socket(callback=self._handle_user_event)
+            # Only mark the stream live once the socket actually started:
+            # the flag gates both the position snapshot cache and the fill
+            # waiters, so a failed start must leave us on the REST paths
+            self._user_stream_started = True
+            logger.info("📡 Subscribed to futures user-data stream")
+        except Exception as e:
+            # Stream is an optimization only - positions fall back to REST polling
+            logger.warning(f"⚠️ Could not start user-data stream: {str(e)}")
+
+    def _handle_user_event(self, msg):
+        """Invalidate the position snapshot cache on account events
+
+        ACCOUNT_UPDATE / ORDER_TRADE_UPDATE events tell us our positions may
+        have changed, so the next get_open_positions call refetches via REST.
+        Between events the cached snapshot is served without an API call.
+
+        Args:
+            msg (dict): User-data event from the websocket stream
+        """
+        try:
+            data = msg.get('data', msg)
+            event_type = data.get('e')
+            if event_type in ('ACCOUNT_UPDATE', 'ORDER_TRADE_UPDATE'):
+                with self._positions_cache_lock:
+                    self._positions_dirty = True
+                # Margin moved - drop the balance snapshots as well
+                self._balance_cache.clear()
+            if event_type == 'ORDER_TRADE_UPDATE':
+                order = data.get('o') or {}
+                if order.get('X') == 'FILLED':
+                    # Hand the fill to a waiter registered for this orderId
+                    # (entry-price discovery) or buffer it briefly in case the
+                    # fill event beats the REST create-order response
+                    order_id = order.get('i')
+                    fill = (float(order.get('ap') or 0.0),
+                            abs(float(order.get('z') or 0.0)))
+                    fill_future = self._pending_fills.pop(order_id, None)
+                    if fill_future is not None:
+                        if not fill_future.done():
+                            fill_future.set_result(fill)
+                    else:
+                        if len(self._recent_fills) > 64:
+                            self._recent_fills.clear()
+                        self._recent_fills[order_id] = fill
+                with self._history_lock:
+                    self._history_dirty = True
+                    # Eagerly refresh in the background (once per burst) so
+                    # the next history view is served from memory instead of
+                    # paying the REST round-trip at render time. Only when
+                    # the cache was ever primed, i.e. someone reads history.
+                    should_prefetch = (self._history_cache_ts > 0
+                                       and not self._history_prefetch_inflight)
+                    if should_prefetch:
+                        self._history_prefetch_inflight = True
+                if should_prefetch:
+                    self._http_pool.submit(self._prefetch_history)
+            if event_type == 'ACCOUNT_CONFIG_UPDATE':
+                # Leverage/margin changed (possibly in the Binance UI) - drop
+                # the cached values so they are re-fetched and re-applied
+                self._leverage_info = {}
+                self._leverage_state.clear()
+                self._margin_state.clear()
+        except Exception as e:
+            logger.warning(f"⚠️ User stream update failed: {str(e)}")
+
+    def _position_info_by_symbol(self, max_age=0.5):
+        """Raw futures_position_information rows indexed by symbol
+
+        Several spots on the order path need "the position rows for this
+        symbol" in quick succession; indexing one response and caching it
+        briefly turns each O(n) scan over ~600 rows into a dict lookup and
+        lets back-to-back callers share a single REST call.
+
+        Args:
+            max_age (float): Cache freshness window in seconds
+
+        Returns:
+            dict: {symbol: [position rows]} - hedge mode yields several rows
+                per symbol, so values are lists
+        """
+        now = time.monotonic()
+        if self._position_info_map is not None and now - self._position_info_ts < max_age:
+            return self._position_info_map
+        info = {}
+        for pos in self.client.futures_position_information():
+            info.setdefault(pos.get('symbol'), []).append(pos)
+        self._position_info_map = info
+        self._position_info_ts = now
+        return info
+
+    def _await_fill(self, order_id, timeout=2.0):
+        """Wait for the fill of an order via the user-data stream
+
+        Args:
+            order_id (int): orderId returned by futures_create_order
+            timeout (float): Seconds to wait for the ORDER_TRADE_UPDATE event
+
+        Returns:
+            tuple or None: (avg_price, filled_qty) if the fill event arrived,
+                None when the stream is down or the event did not come in time
+        """
+        if not self._user_stream_started or order_id is None:
+            return None
+        # The fill event may have beaten the REST response - check the buffer
+        fill = self._recent_fills.pop(order_id, None)
+        if fill is not None:
+            return fill
+        fill_future = Future()
+        self._pending_fills[order_id] = fill_future
+        try:
+            return fill_future.result(timeout)
+        except Exception:
+            return None
+        finally:
+            self._pending_fills.pop(order_id, None)
+
     def get_atr(self, symbol, period=14):
         """Calculate ATR using 15-minute candlestick data from Binance
-        
+
         Args:
             symbol (str): Trading symbol (e.g., 'BTCUSDT')
             period (int): ATR period (default: 14)
-            
+
         Returns:
             float: Calculated ATR value
         """
         try:
             formatted_symbol = self._format_symbol(symbol)
-            logger.info(f"Calculating ATR for {formatted_symbol}, Period: {period}")
-            
-            # Fetch 15m klines (need period + 50 for ATR smoothing)
+
+            # Warm path: ATR maintained incrementally from the kline stream.
+            # State older than two candles means the stream went stale - recompute.
+            with self._atr_lock:
+                state = self._atr_state.get((formatted_symbol, period))
+            if state and time.time() - state[2] < 1800:
+                atr_value = state[0]
+                logger.info("Streamed ATR (15m, %s) for %s: %.4f", period, formatted_symbol, atr_value)
+                return atr_value
+
+            logger.info("Calculating ATR for %s, Period: %s", formatted_symbol, period)
+
+            # Fetch 15m klines - period + 20 warmup samples are enough for the
+            # Wilder smoothing to converge, and the smaller payload costs less
             klines = self.client.futures_klines(
                 symbol=formatted_symbol,
-                interval=Client.KLINE_INTERVAL_15MINUTE,  # 15m interval
-                limit=period + 50
+                interval=self._kline_interval_15m,  # 15m interval
+                limit=period + 20
             )
             
             if len(klines) < period + 1:
-                logger.warning(f"Not enough data for ATR calculation. Need: {period+1}, Got: {len(klines)}")
+                logger.warning("Not enough data for ATR calculation. Need: %s, Got: %s", period + 1, len(klines))
                 return 0.0
             
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 
-                'taker_buy_base', 'taker_buy_quote', 'ignore'
+            # Parse only the three columns we need straight into float64 arrays
+            # (klines carry 12 columns; the DataFrame, five float casts and the
+            # timestamp conversion were wasted work for a single ATR scalar)
+            high = np.array([k[2] for k in klines], dtype=np.float64)
+            low = np.array([k[3] for k in klines], dtype=np.float64)
+            close = np.array([k[4] for k in klines], dtype=np.float64)
+
+            # One fused finiteness reduction per column (NaN and Inf in a
+            # single SIMD pass); only pay the forward-fill when a column is
+            # actually dirty, which is rare
+            for arr in (high, low, close):
+                finite = np.isfinite(arr)
+                if not finite.all():
+                    logger.warning("⚠️ Non-finite kline values for %s, forward-filling", formatted_symbol)
+                    idx = np.where(finite, np.arange(arr.size), 0)
+                    np.maximum.accumulate(idx, out=idx)
+                    arr[:] = arr[idx]
+
+            # Calculate True Range fully vectorized - three aligned arrays and
+            # C-level ufuncs instead of a per-row Python apply
+            prev_close = np.roll(close, 1)
+            tr_values = np.maximum.reduce([
+                high - low,
+                np.abs(high - prev_close),
+                np.abs(low - prev_close),
             ])
-            
-            # Convert to float
-            df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Calculate ATR
-            df['previous_close'] = df['close'].shift(1)
-            df['tr'] = df[['high', 'low', 'previous_close']].apply(
-                lambda x: max(
-                    x['high'] - x['low'],
-                    abs(x['high'] - x['previous_close']),
-                    abs(x['low'] - x['previous_close'])
-                ), axis=1
-            )
-            
-            # Wilder's ATR (EMA with alpha=1/period)
-            df['ATR'] = df['tr'].ewm(alpha=1/period, adjust=False).mean()
-            
-            atr_value = df['ATR'].iloc[-1]
-            logger.info(f"Calculated ATR (15m, {period}) for {formatted_symbol}: {atr_value:.4f}")
+            # First candle has no previous close - plain high-low range
+            tr_values[0] = high[0] - low[0]
+
+            # Wilder's ATR (EMA with alpha=1/period) - JIT-compiled recurrence
+            atr_value = float(_wilder_atr(tr_values, period))
+            logger.info("Calculated ATR (15m, %s) for %s: %.4f", period, formatted_symbol, atr_value)
+
+            # Seed the incremental state and keep it fresh via the kline stream
+            with self._atr_lock:
+                self._atr_state[(formatted_symbol, period)] = (
+                    float(atr_value), float(close[-1]), time.time()
+                )
+            self._ensure_kline_stream(formatted_symbol)
+
             return atr_value
                 
-        except Exception as e:
-            logger.error(f"ATR calculation failed for {symbol}: {str(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("ATR calculation failed for %s", symbol)
             return 0.0
-    
+
+    def get_atr_batch(self, symbols, period=14):
+        """Calculate ATR for several symbols concurrently
+
+        Each cold get_atr call is dominated by the futures_klines network
+        round-trip, so a sequential multi-symbol scan pays N latencies.
+        Fanning out over a thread pool overlaps the I/O; symbols with warm
+        streamed state return immediately without touching the network.
+
+        Args:
+            symbols (list): Trading symbols
+            period (int): ATR period (default: 14)
+
+        Returns:
+            dict: {formatted_symbol: atr_value} - failures map to 0.0
+        """
+        symbols = [self._format_symbol(s) for s in symbols]
+        if len(symbols) <= 1:
+            return {s: self.get_atr(s, period) for s in symbols}
+
+        with ThreadPoolExecutor(max_workers=min(16, len(symbols)),
+                                thread_name_prefix='binance-atr') as pool:
+            atr_values = pool.map(lambda s: self.get_atr(s, period), symbols)
+            return dict(zip(symbols, atr_values))
+
+    def _execute_raw_order(self, symbol, binance_side, position_side, quantity, reduce_only=True, is_one_way_mode=None):
+        """Place a single market order directly, skipping the full place_order setup
+
+        Used for closing the opposite position during auto position switch,
+        where validation, leverage, margin and balance work has already been
+        done for the order that triggered the switch.
+
+        Args:
+            symbol (str): Trading symbol
+            binance_side (str): 'BUY' or 'SELL'
+            position_side (str): 'LONG' or 'SHORT' (used in HEDGE mode only)
+            quantity (float): Order quantity
+            reduce_only (bool): Send reduceOnly in ONE-WAY mode (default: True)
+            is_one_way_mode (bool, optional): Position mode already known by
+                the caller; when None it is fetched here
+
+        Returns:
+            dict: Order response or {"error": ...}
+        """
+        try:
+            formatted_symbol = self._format_symbol(symbol)
+
+            # positionSide is only valid in HEDGE mode (see BUG FIX #1)
+            if is_one_way_mode is None:
+                try:
+                    is_one_way_mode = self._is_one_way_mode()
+                except Exception as pm_err:
+                    logger.warning(f"⚠️ Could not detect position mode: {pm_err}, assuming ONE-WAY")
+                    is_one_way_mode = True
+
+            try:
+                quantity = self._format_quantity(formatted_symbol, quantity)
+            except ValueError as ve:
+                logger.error(f"❌ Quantity formatting failed: {ve}")
+                return {"error": str(ve)}
+
+            order_params = {
+                'symbol': formatted_symbol,
+                'side': binance_side,
+                'type': 'MARKET',
+                'quantity': quantity,
+            }
+            if not is_one_way_mode:
+                order_params['positionSide'] = position_side
+            elif reduce_only:
+                order_params['reduceOnly'] = True
+
+            logger.info("📤 Direct order: %s %s qty=%s", formatted_symbol, binance_side, quantity)
+            order_result = self.client.futures_create_order(**order_params)
+            logger.info("✅ Direct order executed: %s", order_result.get('orderId', 'N/A'))
+            # The close released margin - make the caller's follow-up balance
+            # read go to the exchange even if the user stream is down
+            self._balance_cache.clear()
+            return order_result
+
+        except Exception as e:
+            logger.exception("❌ Direct order failed for %s: %s", symbol, str(e))
+            return {"error": str(e)}
+
     def place_order(self, symbol, side, order_type="MARKET", quantity=None, product_type='USDT-FUTURES'):
         """
         Place order on Binance Futures with TP/SL
@@ -336,23 +1114,23 @@ class BinanceHandler:
             dict: Order response
         """
         try:
-            logger.info(f"🚀 ENHANCED ORDER PLACEMENT START")
-            logger.info(f"   Symbol: {symbol}")
-            logger.info(f"   Side: {side}")
-            logger.info(f"   Product Type: {product_type}")
+            logger.info("🚀 ENHANCED ORDER PLACEMENT START")
+            logger.info("   Symbol: %s", symbol)
+            logger.info("   Side: %s", side)
+            logger.info("   Product Type: %s", product_type)
             
             # Check if trading is enabled
-            if not self.config.get('enable_trading', False):
+            if not self._enable_trading:
                 logger.info("❌ Trading is disabled globally")
                 return {"error": "Trading is disabled"}
             
-            # Check coin-specific trading status
-            if not self.coin_config_manager.is_trading_enabled(symbol):
-                return {"error": f"Trading is disabled for {symbol}"}
-            
-            # Format symbol
+            # Format symbol once up front and reuse it everywhere below
             formatted_symbol = self._format_symbol(symbol)
-            
+
+            # Check coin-specific trading status
+            if not self.coin_config_manager.is_trading_enabled(formatted_symbol):
+                return {"error": f"Trading is disabled for {formatted_symbol}"}
+
             # Parse side
             parts = side.split('_')
             if len(parts) != 2:
@@ -361,26 +1139,45 @@ class BinanceHandler:
             action = parts[0]  # open or close
             direction = parts[1]  # long or short
             
-            # Get coin configuration
-            coin_config = self.coin_config_manager.get_coin_config(symbol)
-            
-            # Set leverage
-            self.set_leverage(formatted_symbol, coin_config['leverage'])
-            
-            # Set margin type
-            self.set_margin_type(formatted_symbol, 'CROSSED')
-            
+            # Get coin configuration (same cache key as the trading check above)
+            coin_config = self.coin_config_manager.get_coin_config(formatted_symbol)
+
+            # Set leverage, set margin type and fetch balance concurrently -
+            # three independent round-trips, so pay max(t) instead of the sum.
+            # Leverage/margin calls are skipped entirely when the last applied
+            # state for this symbol already matches.
+            margin_asset = self._get_margin_asset(formatted_symbol)
+            leverage_future = None
+            margin_future = None
+            if self._leverage_state.get(formatted_symbol) != coin_config['leverage']:
+                leverage_future = self._http_pool.submit(self.set_leverage, formatted_symbol, coin_config['leverage'])
+            if self._margin_state.get(formatted_symbol) != 'CROSSED':
+                margin_future = self._http_pool.submit(self.set_margin_type, formatted_symbol, 'CROSSED')
+            balance_future = self._http_pool.submit(self.get_account_balance, margin_asset)
+            # Position mode is needed later (BUG FIX #1) - resolve it in the
+            # same fan-out (served from the TTL cache after the first order)
+            mode_future = self._http_pool.submit(self._is_one_way_mode)
+            # Only remember state on success so failures are retried next order
+            if leverage_future is not None and leverage_future.result() is not None:
+                self._leverage_state[formatted_symbol] = coin_config['leverage']
+            if margin_future is not None and margin_future.result() is not None:
+                self._margin_state[formatted_symbol] = 'CROSSED'
+
             # Get current positions for validation
             current_positions = self.get_open_positions()
             
-            # Validate position request
-            auto_switch_enabled = self.config.get('auto_position_switch', True)
-            validation_result = self.position_validator.validate_position_request(
-                symbol, direction, action, current_positions, auto_switch_enabled
-            )
+            # Validate position request. With no open positions an 'open' can
+            # never conflict - skip the validator's per-position diff work.
+            auto_switch_enabled = self._auto_position_switch
+            if action == 'open' and not current_positions:
+                validation_result = {'allowed': True}
+            else:
+                validation_result = self.position_validator.validate_position_request(
+                    symbol, direction, action, current_positions, auto_switch_enabled
+                )
             
             if not validation_result['allowed']:
-                logger.warning(f"❌ Position request REJECTED: {validation_result['reason']}")
+                logger.warning("❌ Position request REJECTED: %s", validation_result['reason'])
                 return {"error": validation_result['reason']}
             
             # Handle required actions (e.g., close opposite position)
@@ -390,41 +1187,60 @@ class BinanceHandler:
                 if action_type == 'close_opposite':
                     logger.info("🔄 Auto position switch: Closing opposite position...")
                     positions_to_close = validation_result['action_required']['positions_to_close']
-                    
+
+                    # Reuse the position mode already being fetched in the
+                    # preflight fan-out instead of re-detecting per close
+                    try:
+                        switch_one_way = mode_future.result()
+                    except Exception:
+                        switch_one_way = None
+
                     for pos in positions_to_close:
-                        close_side = f"close_{pos['side']}"
-                        close_result = self.place_order(symbol, close_side, quantity=pos['size'])
-                        
+                        # Direct close - no recursive place_order (validation,
+                        # leverage and balance setup were already done here)
+                        close_binance_side = 'SELL' if pos['side'] == 'long' else 'BUY'
+                        close_result = self._execute_raw_order(
+                            formatted_symbol, close_binance_side, pos['side'].upper(), pos['size'],
+                            is_one_way_mode=switch_one_way
+                        )
+
                         if not close_result or 'error' in close_result:
                             logger.error(f"❌ Failed to close opposite position")
                             return {"error": "Failed to close opposite position"}
             
-            # Get account balance
-            margin_asset = self._get_margin_asset(formatted_symbol)
-            available_balance, total_balance, unrealized_pnl = self.get_account_balance(margin_asset)
-            
+            # Get account balance (prefetched above; re-fetch if an opposite
+            # position was just closed, since that releases margin)
+            if validation_result.get('action_required'):
+                available_balance, total_balance, unrealized_pnl = self.get_account_balance(margin_asset)
+            else:
+                available_balance, total_balance, unrealized_pnl = balance_future.result()
+
             if available_balance <= 0:
                 logger.warning("Zero available balance, using dummy value for testing")
                 available_balance = 1000.0
             
+            # Fetch the price once and reuse it for sizing, the notional check
+            # and the TP/SL fallback below (no repeated round-trips)
+            current_price = self.get_symbol_price(formatted_symbol)
+
             # Calculate order quantity
             if quantity is None:
-                current_price = self.get_symbol_price(formatted_symbol)
                 if current_price <= 0:
                     return {"error": "Failed to get current price"}
-                
+
                 # Calculate order size
                 order_amount = available_balance * (coin_config['order_size_percentage'] / 100)
                 leveraged_amount = order_amount * coin_config['leverage']
                 quantity = leveraged_amount / current_price
                 
-                logger.info(f"📊 Order Calculation:")
-                logger.info(f"   💰 Balance: ${available_balance:.2f}")
-                logger.info(f"   📈 Order %: {coin_config['order_size_percentage']}%")
-                logger.info(f"   🔥 Leverage: {coin_config['leverage']}x")
-                logger.info(f"   💵 Base Amount: ${order_amount:.2f}")
-                logger.info(f"   💪 Leveraged: ${leveraged_amount:.2f}")
-                logger.info(f"   🎯 Quantity: {quantity:.6f}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📊 Order Calculation:")
+                    logger.info("   💰 Balance: $%.2f", available_balance)
+                    logger.info("   📈 Order %%: %s%%", coin_config['order_size_percentage'])
+                    logger.info("   🔥 Leverage: %sx", coin_config['leverage'])
+                    logger.info("   💵 Base Amount: $%.2f", order_amount)
+                    logger.info("   💪 Leveraged: $%.2f", leveraged_amount)
+                    logger.info("   🎯 Quantity: %.6f", quantity)
             
             # Determine Binance API side and position side
             if action == 'open':
@@ -440,9 +1256,8 @@ class BinanceHandler:
             # ----------------------------------------------------------------
             is_one_way_mode = True
             try:
-                position_mode = self.client.futures_get_position_mode()
-                is_one_way_mode = not position_mode.get('dualSidePosition', False)
-                logger.info(f"📌 Position mode: {'ONE-WAY' if is_one_way_mode else 'HEDGE'}")
+                is_one_way_mode = mode_future.result()
+                logger.info("📌 Position mode: %s", 'ONE-WAY' if is_one_way_mode else 'HEDGE')
             except Exception as pm_err:
                 logger.warning(f"⚠️ Could not detect position mode: {pm_err}, assuming ONE-WAY")
                 is_one_way_mode = True
@@ -450,17 +1265,17 @@ class BinanceHandler:
             # BUG FIX #4: Format quantity before placing order
             try:
                 quantity = self._format_quantity(formatted_symbol, quantity)
-                logger.info(f"✅ Formatted quantity: {quantity}")
+                logger.info("✅ Formatted quantity: %s", quantity)
             except ValueError as ve:
                 logger.error(f"❌ Quantity formatting failed: {ve}")
                 return {"error": str(ve)}
 
             # Binance Futures min notional: 100 USDT (API -4164)
             if action == 'open':
-                price_for_notional = self.get_symbol_price(formatted_symbol)
+                price_for_notional = current_price
                 if price_for_notional and price_for_notional > 0:
                     notional = float(quantity) * price_for_notional
-                    logger.info(f"   Notional check: qty={quantity} x price={price_for_notional:.4f} = ${notional:.2f} (min $100)")
+                    logger.info("   Notional check: qty=%s x price=%.4f = $%.2f (min $100)", quantity, price_for_notional, notional)
                     if notional < 100:
                         msg = (
                             f"Order notional (${notional:.2f}) is below Binance minimum of $100. "
@@ -470,11 +1285,11 @@ class BinanceHandler:
                         return {"error": msg}
 
             # Place main order
-            logger.info(f"📤 Placing order:")
-            logger.info(f"   Symbol: {formatted_symbol}")
-            logger.info(f"   Side: {binance_side}")
-            logger.info(f"   Position Mode: {'ONE-WAY' if is_one_way_mode else 'HEDGE'}")
-            logger.info(f"   Quantity: {quantity}")
+            logger.info("📤 Placing order:")
+            logger.info("   Symbol: %s", formatted_symbol)
+            logger.info("   Side: %s", binance_side)
+            logger.info("   Position Mode: %s", 'ONE-WAY' if is_one_way_mode else 'HEDGE')
+            logger.info("   Quantity: %s", quantity)
 
             order_params = {
                 'symbol': formatted_symbol,
@@ -484,46 +1299,55 @@ class BinanceHandler:
             }
             if not is_one_way_mode:
                 order_params['positionSide'] = position_side
-                logger.info(f"   positionSide: {position_side} (HEDGE mode)")
+                logger.info("   positionSide: %s (HEDGE mode)", position_side)
             else:
                 if action == 'close':
                     order_params['reduceOnly'] = True
-                logger.info(f"   reduceOnly: {order_params.get('reduceOnly', False)} (ONE-WAY mode)")
+                logger.info("   reduceOnly: %s (ONE-WAY mode)", order_params.get('reduceOnly', False))
+
+            # ATR only depends on klines, not on the entry fill - fetch it
+            # while the entry order round-trip is in flight so the protective
+            # TP/SL placement below starts as soon as the order returns
+            atr_future = None
+            if action == 'open':
+                atr_period = self.tp_sl_manager.get_atr_period(symbol)
+                atr_future = self._http_pool.submit(self.get_atr, formatted_symbol, atr_period)
 
-            logger.info(f"   Calling Binance API futures_create_order (symbol={formatted_symbol}, side={binance_side}, type={order_type}, quantity={quantity})")
+            logger.info("   Calling Binance API futures_create_order (symbol=%s, side=%s, type=%s, quantity=%s)", formatted_symbol, binance_side, order_type, quantity)
             try:
                 order_result = self.client.futures_create_order(**order_params)
             except Exception as api_err:
-                logger.error(f"❌ Binance API order failed: {type(api_err).__name__}: {api_err}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.error(f"❌ Binance API order failed: {type(api_err).__name__}: {api_err}", exc_info=True)
                 return {"error": str(api_err)}
 
-            logger.info(f"✅ Order placed successfully!")
-            logger.info(f"   Order ID: {order_result['orderId']}")
+            logger.info("✅ Order placed successfully!")
+            logger.info("   Order ID: %s", order_result['orderId'])
 
             # Place TP/SL orders for open positions
             if action == 'open':
                 try:
-                    # Get ATR value using 1h data
-                    atr_period = self.tp_sl_manager.get_atr_period(symbol)
-                    atr_value = self.get_atr(formatted_symbol, atr_period)
+                    # ATR fetch was overlapped with the entry round-trip above
+                    atr_value = atr_future.result()
 
                     if atr_value > 0:
                         # BUG FIX #5: MARKET orders return avgPrice="0" immediately.
-                        # Wait briefly then fetch real market price for accurate TP/SL.
+                        # Reuse the price fetched during sizing instead of paying
+                        # another round-trip; only re-fetch if that fetch failed.
                         avg_price_raw = order_result.get('avgPrice', '0')
                         if avg_price_raw and float(avg_price_raw) > 0:
                             current_price = float(avg_price_raw)
-                        else:
+                        elif current_price <= 0:
                             time.sleep(0.3)
                             current_price = self.get_symbol_price(formatted_symbol)
-                        logger.info(f"   Entry price used for TP/SL: ${current_price:.4f}")
+                        logger.info("   Entry price used for TP/SL: $%.4f", current_price)
 
-                        # Calculate TP/SL prices
+                        # Calculate TP/SL prices, then snap them once to the
+                        # live tickSize so the exchange never rejects stopPrice
                         tp_price, sl_price = self.tp_sl_manager.calculate_tp_sl_prices(
                             symbol, current_price, atr_value, direction
                         )
+                        tp_price = self._round_price_to_tick(formatted_symbol, tp_price)
+                        sl_price = self._round_price_to_tick(formatted_symbol, sl_price)
 
                         # Validate TP/SL logic
                         is_valid = self.tp_sl_manager.validate_tp_sl_logic(
@@ -544,29 +1368,45 @@ class BinanceHandler:
                             if not is_one_way_mode:
                                 tp_base_params['positionSide'] = position_side
 
-                            # Place TP order
-                            try:
-                                tp_order = self.client.futures_create_order(
-                                    **tp_base_params,
-                                    type='TAKE_PROFIT_MARKET',
-                                    stopPrice=tp_price,
-                                )
-                                tp_order_success = True
-                                logger.info(f"✅ TP order placed: ${tp_price:.4f} (Order ID: {tp_order.get('orderId', 'N/A')})")
-                            except Exception as tp_error:
-                                logger.error(f"❌ Failed to place TP order: {str(tp_error)}")
+                            # Submit TP and SL as one batchOrders POST - a
+                            # single signed round-trip instead of two, and
+                            # per-order failures come back inline as
+                            # {code, msg} entries instead of raising
+                            def _submit_single(stop_type, stop_price):
+                                try:
+                                    return self.client.futures_create_order(
+                                        **tp_base_params, type=stop_type, stopPrice=stop_price
+                                    )
+                                except Exception as order_err:
+                                    return {'msg': str(order_err)}
 
-                            # Place SL order
                             try:
-                                sl_order = self.client.futures_create_order(
-                                    **tp_base_params,
-                                    type='STOP_MARKET',
-                                    stopPrice=sl_price,
-                                )
-                                sl_order_success = True
-                                logger.info(f"✅ SL order placed: ${sl_price:.4f} (Order ID: {sl_order.get('orderId', 'N/A')})")
-                            except Exception as sl_error:
-                                logger.error(f"❌ Failed to place SL order: {str(sl_error)}")
+                                tp_result, sl_result = self.client.futures_place_batch_order(batchOrders=[
+                                    {**tp_base_params, 'closePosition': 'true',
+                                     'type': 'TAKE_PROFIT_MARKET', 'stopPrice': str(tp_price)},
+                                    {**tp_base_params, 'closePosition': 'true',
+                                     'type': 'STOP_MARKET', 'stopPrice': str(sl_price)},
+                                ])
+                            except Exception as batch_error:
+                                # Top-level batch failure (endpoint/transport) -
+                                # fall back to two concurrent single orders
+                                logger.warning("⚠️ TP/SL batch call failed (%s), falling back to single orders", batch_error)
+                                tp_future = self._http_pool.submit(_submit_single, 'TAKE_PROFIT_MARKET', tp_price)
+                                sl_future = self._http_pool.submit(_submit_single, 'STOP_MARKET', sl_price)
+                                tp_result = tp_future.result()
+                                sl_result = sl_future.result()
+
+                            tp_order_success = tp_result.get('orderId') is not None
+                            if tp_order_success:
+                                logger.info("✅ TP order placed: $%.4f (Order ID: %s)", tp_price, tp_result['orderId'])
+                            else:
+                                logger.error("❌ Failed to place TP order: %s", tp_result.get('msg', 'Unknown error'))
+
+                            sl_order_success = sl_result.get('orderId') is not None
+                            if sl_order_success:
+                                logger.info("✅ SL order placed: $%.4f (Order ID: %s)", sl_price, sl_result['orderId'])
+                            else:
+                                logger.error("❌ Failed to place SL order: %s", sl_result.get('msg', 'Unknown error'))
                                 logger.warning(f"⚠️  WARNING: Entry order placed but SL order failed! Position is unprotected!")
 
                             if tp_order_success or sl_order_success:
@@ -582,16 +1422,12 @@ class BinanceHandler:
                                 logger.warning(f"   Entry order ID: {order_result.get('orderId', 'N/A')}")
                                 logger.warning(f"   Please manually place a stop loss order!")
                 except Exception as tp_sl_error:
-                    logger.error(f"❌ Error in TP/SL placement process: {str(tp_sl_error)}")
-                    import traceback
-                    logger.error(f"Traceback: {traceback.format_exc()}")
+                    logger.exception("❌ Error in TP/SL placement process: %s", str(tp_sl_error))
             
             return order_result
             
         except Exception as e:
-            logger.error(f"❌ Order placement error: {str(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Order placement error: %s", str(e))
             return {"error": str(e)}
     
     def get_open_positions(self):
@@ -601,59 +1437,165 @@ class BinanceHandler:
             list: List of open positions
         """
         try:
+            self._ensure_user_stream()
+
+            # Serve the cached snapshot while the user-data stream confirms
+            # nothing changed; the TTL guards against silently dropped events.
+            # Without a live stream nothing would ever mark the cache dirty,
+            # so every call must hit REST
+            now = time.time()
+            with self._positions_cache_lock:
+                if (self._user_stream_started
+                        and self._positions_cache is not None
+                        and not self._positions_dirty
+                        and now - self._positions_cache_ts < 10.0):
+                    logger.debug("Serving open positions from user-stream cache")
+                    return self._positions_cache
+
             logger.info("Fetching open positions from Binance...")
-            
+
             # Get position information
             positions = self.client.futures_position_information()
             
-            # Filter active positions
+            # Filter active positions - a cheap string test skips the float()
+            # parse for the flat rows that dominate the ~600-row response
+            # ('0', '0.000' and '-0.000' all strip down to empty)
             active_positions = []
             for pos in positions:
-                position_amt = abs(float(pos.get('positionAmt', '0')))
+                raw_amt = pos.get('positionAmt', '0')
+                if raw_amt.lstrip('-0.') == '':
+                    continue
+                position_amt = abs(float(raw_amt))
                 if position_amt > 0:
-                    logger.info(f"Active position: {pos['symbol']} {pos['positionSide']} {position_amt}")
+                    logger.info("Active position: %s %s %s", pos['symbol'], pos['positionSide'], position_amt)
                     active_positions.append(pos)
-            
-            logger.info(f"Found {len(active_positions)} active positions")
+
+            # Newer position endpoints omit leverage; backfill it from a
+            # by-symbol map built with a single futures_account fetch. The map
+            # is cached for 60s (leverage rarely changes) and evicted early by
+            # ACCOUNT_CONFIG_UPDATE events from the user stream.
+            if any('leverage' not in pos for pos in active_positions):
+                try:
+                    if not self._leverage_info or now - self._leverage_info_ts > 60:
+                        account_info = self.client.futures_account()
+                        self._leverage_info = {
+                            a['symbol']: a.get('leverage', '1')
+                            for a in account_info.get('positions', [])
+                        }
+                        self._leverage_info_ts = now
+                    for pos in active_positions:
+                        if 'leverage' not in pos:
+                            pos['leverage'] = self._leverage_info.get(pos['symbol'], '1')
+                except Exception as lev_err:
+                    logger.warning(f"⚠️ Could not backfill leverage info: {str(lev_err)}")
+
+            logger.info("Found %s active positions", len(active_positions))
+
+            with self._positions_cache_lock:
+                self._positions_cache = active_positions
+                self._positions_cache_ts = now
+                self._positions_dirty = False
+
             return active_positions
             
         except Exception as e:
             logger.error(f"Failed to get open positions: {str(e)}")
             return []
     
-    def get_position_history(self, limit=50):
+    def _prefetch_history(self):
+        """Refresh the trade-history cache after a fill event (background)"""
+        try:
+            self.get_position_history(limit=self._history_cache_limit or 50)
+        except Exception as e:
+            logger.warning(f"⚠️ History prefetch failed: {str(e)}")
+        finally:
+            with self._history_lock:
+                self._history_prefetch_inflight = False
+
+    def get_position_history(self, limit=50, symbols=None):
         """Get position history from Binance
-        
+
         Args:
             limit (int): Number of records to fetch
-            
+            symbols (list, optional): Symbols to query (defaults to all symbols we trade)
+
         Returns:
             list: Trade history
         """
         try:
+            # Serve the last snapshot while the user-data stream reports no new
+            # fills (narrowed symbol queries bypass the shared cache)
+            use_cache = symbols is None
+            if use_cache:
+                self._ensure_user_stream()
+                now = time.time()
+                with self._history_lock:
+                    if (self._history_cache_ts > 0
+                            and not self._history_dirty
+                            and self._history_cache_limit >= limit
+                            and now - self._history_cache_ts < 300.0):
+                        logger.debug("Serving trade history from user-stream cache")
+                        return self._trade_cache[:limit]
+
+                # A deeper page than the cursors ever covered - start over so
+                # older trades are actually fetched
+                if limit > self._history_cache_limit and self._history_cache_limit > 0:
+                    with self._history_lock:
+                        self._last_trade_id.clear()
+                        self._trade_cache = []
+
             logger.info("Fetching trade history from Binance...")
-            
-            # Get all symbols we trade
-            symbols = []
-            for coin in ['btc', 'eth', 'xrp', 'ada', 'dot', 'xlm', 'imx', 'doge', 'inj', 'ldo', 'arb', 'uni', 'sol', 'bnb', 'fet']:
-                symbols.append(f"{coin.upper()}USDT")
-            for coin in ['btcusdc', 'ethusdc', 'solusdc', 'aaveusdc', 'bchusdc', 'xrpusdc', 'adausdc', 'avaxusdc', 'linkusdc', 'arbusdc', 'uniusdc', 'crvusdc', 'tiausdc', 'bnbusdc', 'filusdc']:
-                symbols.append(coin.upper())
-            
-            all_trades = []
-            
-            for symbol in symbols:
+
+            # Use the precomputed symbol list unless the caller narrows it down
+            if symbols is None:
+                symbols = _DEFAULT_SYMBOLS
+
+            def fetch_symbol_trades(symbol):
                 try:
-                    trades = self.client.futures_account_trades(symbol=symbol, limit=limit)
-                    all_trades.extend(trades)
+                    # Incremental refresh: only trades newer than the last
+                    # seen ID for this symbol (usually an empty response)
+                    from_id = self._last_trade_id.get(symbol) if use_cache else None
+                    if from_id is not None:
+                        return self.client.futures_account_trades(
+                            symbol=symbol, fromId=from_id + 1, limit=limit,
+                            recvWindow=5000)
+                    return self.client.futures_account_trades(
+                        symbol=symbol, limit=limit, recvWindow=5000)
                 except:
-                    continue
-            
-            # Sort by time (newest first)
-            all_trades.sort(key=lambda x: x['time'], reverse=True)
-            
-            logger.info(f"Retrieved {len(all_trades)} trades")
-            return all_trades[:limit]
+                    return []
+
+            # The ~30 per-symbol queries are independent I/O - fan them out so
+            # the refresh costs ~1 round-trip instead of 30 serial ones. A
+            # modest worker count keeps the burst inside the request-weight
+            # budget (the keep-alive pool reuses connections across workers).
+            all_trades = []
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix='trade-history') as pool:
+                for trades in pool.map(fetch_symbol_trades, symbols):
+                    all_trades.extend(trades)
+
+            if use_cache:
+                with self._history_lock:
+                    # Advance cursors and merge the new trades into the capped
+                    # cache - nlargest keeps the newest 1000 in O(n log 1000)
+                    # without sorting everything that falls off the end
+                    for trade in all_trades:
+                        if trade['id'] > self._last_trade_id.get(trade['symbol'], -1):
+                            self._last_trade_id[trade['symbol']] = trade['id']
+                    self._trade_cache = heapq.nlargest(
+                        1000, self._trade_cache + all_trades, key=itemgetter('time'))
+
+                    self._history_cache_limit = max(self._history_cache_limit, limit)
+                    self._history_cache_ts = time.time()
+                    self._history_dirty = False
+                    result = self._trade_cache[:limit]
+
+                logger.info("Retrieved %s new trades (%s returned)", len(all_trades), len(result))
+                return result
+
+            # Narrowed query - top-K selection beats sorting the whole merge
+            # when only `limit` of symbols x limit rows survive
+            logger.info("Retrieved %s trades", len(all_trades))
+            return heapq.nlargest(limit, all_trades, key=itemgetter('time'))
             
         except Exception as e:
             logger.error(f"Failed to get position history: {str(e)}")
@@ -669,62 +1611,131 @@ class BinanceHandler:
             list: Formatted positions
         """
         try:
-            formatted_positions = []
-            
-            for pos in positions:
-                position_amt = float(pos.get('positionAmt', '0'))
-                if position_amt == 0:
-                    continue
-                
-                side = pos.get('positionSide', 'BOTH')
-                entry_price = float(pos.get('entryPrice', '0'))
-                mark_price = float(pos.get('markPrice', '0'))
-                unrealized_pnl = float(pos.get('unrealizedProfit', '0'))
-                leverage = int(pos.get('leverage', '1'))
-                
-                # Calculate PnL percentage
-                if entry_price > 0:
-                    pnl_percentage = (unrealized_pnl / (abs(position_amt) * entry_price)) * 100 * leverage
-                else:
-                    pnl_percentage = 0
-                
-                formatted_pos = {
-                    'symbol': pos['symbol'],
-                    'side': side,
-                    'size': f"{abs(position_amt):.4f}",
-                    'entry_price': f"${entry_price:.4f}",
-                    'current_price': f"${mark_price:.4f}",
-                    'unrealized_pnl': f"${unrealized_pnl:.2f}",
-                    'pnl_percentage': f"{pnl_percentage:.2f}%",
-                    'leverage': f"{leverage}x",
-                    'margin_type': pos.get('marginType', 'cross'),
-                    'liquidation_price': f"${float(pos.get('liquidationPrice', '0')):.4f}"
-                }
-                
-                formatted_positions.append(formatted_pos)
-            
+            if not positions:
+                return []
+
+            # Same string pre-filter as get_open_positions: flat rows are
+            # dropped before any per-field float parsing happens
+            positions = [p for p in positions
+                         if str(p.get('positionAmt', '0')).lstrip('-0.') != '']
+            if not positions:
+                return []
+
+            # Pull numeric fields into NumPy arrays once so the PnL math runs
+            # in a single vectorized pass instead of per-position Python loops
+            count = len(positions)
+            amt = np.fromiter((float(p.get('positionAmt', '0')) for p in positions), dtype=np.float64, count=count)
+            mask = amt != 0
+            if not mask.any():
+                return []
+
+            open_positions = [p for p, keep in zip(positions, mask) if keep]
+            count = len(open_positions)
+            amt = amt[mask]
+            entry = np.fromiter((float(p.get('entryPrice', '0')) for p in open_positions), dtype=np.float64, count=count)
+            mark = np.fromiter((float(p.get('markPrice', '0')) for p in open_positions), dtype=np.float64, count=count)
+            pnl = np.fromiter((float(p.get('unrealizedProfit', '0')) for p in open_positions), dtype=np.float64, count=count)
+            leverage = np.fromiter((int(p.get('leverage', '1')) for p in open_positions), dtype=np.int64, count=count)
+            liq = np.fromiter((float(p.get('liquidationPrice', '0')) for p in open_positions), dtype=np.float64, count=count)
+
+            # Calculate PnL percentage. The entry-based denominator is computed
+            # once; rows with no usable entry price fall back to the
+            # exchange-reported notional instead of flatlining at 0%.
+            abs_amt = np.abs(amt)
+            notional = np.fromiter(
+                (abs(float(p.get('notional') or 0.0)) for p in open_positions),
+                dtype=np.float64, count=count
+            )
+            with np.errstate(divide='ignore', invalid='ignore'):
+                denom = abs_amt * entry
+                denom = np.where(denom > 0, denom, notional)
+                pnl_pct = np.where(denom > 0, pnl / denom * 100 * leverage, 0.0)
+
+            # Row formatting is memoized - on a stable book successive
+            # dashboard refreshes reuse the cached strings instead of
+            # re-running eight f-string float formats per position
+            formatted_positions = [
+                dict(self._format_dashboard_row(
+                    pos['symbol'],
+                    pos.get('positionSide', 'BOTH'),
+                    float(abs_amt[i]), float(entry[i]), float(mark[i]),
+                    float(pnl[i]), float(pnl_pct[i]), int(leverage[i]),
+                    pos.get('marginType', 'cross'), float(liq[i])
+                ))
+                for i, pos in enumerate(open_positions)
+            ]
+
             return formatted_positions
             
         except Exception as e:
             logger.error(f"Error formatting positions: {str(e)}")
             return []
-    
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _format_dashboard_row(symbol, side, abs_amt, entry, mark, pnl, pnl_pct,
+                              leverage, margin_type, liq):
+        """Format one dashboard row (memoized - pure function of its inputs)
+
+        Returns:
+            dict: Formatted position fields (callers should copy before mutating)
+        """
+        return {
+            'symbol': symbol,
+            'side': side,
+            'size': f"{abs_amt:.4f}",
+            'entry_price': f"${entry:.4f}",
+            'current_price': f"${mark:.4f}",
+            'unrealized_pnl': f"${pnl:.2f}",
+            'pnl_percentage': f"{pnl_pct:.2f}%",
+            'leverage': f"{leverage}x",
+            'margin_type': margin_type,
+            'liquidation_price': f"${liq:.4f}"
+        }
+
     def monitor_positions(self):
-        """Monitor positions continuously and cleanup orphaned trailing stops"""
+        """Monitor positions continuously and cleanup orphaned trailing stops
+
+        The poll interval adapts to activity: it doubles up to 30s while the
+        book is unchanged and snaps back to 1s the moment a position opens,
+        closes or resizes.
+        """
+        interval = 5.0
+        last_snapshot = None
         while True:
             try:
                 current_positions = self.get_open_positions()
-                
-                # Update position states
+
+                # Update position states as compact typed snapshots instead
+                # of keeping whole Binance payload dicts alive per tick
                 for pos in current_positions:
                     pos_id = f"{pos['symbol']}_{pos['positionSide']}"
-                    self.last_position_states[pos_id] = pos
-                
+                    self.last_position_states[pos_id] = PositionState(
+                        symbol=pos['symbol'],
+                        side=pos.get('positionSide', 'BOTH'),
+                        amt=float(pos.get('positionAmt', '0')),
+                        entry=float(pos.get('entryPrice', '0')),
+                        mark=float(pos.get('markPrice', '0')),
+                        upnl=float(pos.get('unrealizedProfit', '0')),
+                        leverage=int(pos.get('leverage', '1')),
+                        margin_type=pos.get('marginType', 'cross'),
+                    )
+
                 # Cleanup orphaned trailing stops (position closed but trailing stop still open)
                 self.cleanup_orphaned_trailing_stops()
-                
-                time.sleep(5)  # Check every 5 seconds
-                
+
+                snapshot = frozenset(
+                    (pos['symbol'], pos.get('positionSide', 'BOTH'), pos.get('positionAmt', '0'))
+                    for pos in current_positions
+                )
+                if snapshot == last_snapshot:
+                    interval = min(interval * 2, 30.0)
+                else:
+                    interval = 1.0
+                last_snapshot = snapshot
+
+                time.sleep(interval)
+
             except Exception as e:
                 logger.error(f"Error in position monitoring: {e}")
                 time.sleep(5)
@@ -743,34 +1754,100 @@ class BinanceHandler:
         try:
             direction = side.replace('open_', '').upper()
             
-            message = (
-                f"🚀 NEW {direction} POSITION OPENED\n"
-                f"💰 Symbol: {symbol}\n"
-                f"📈 Entry Price: ${price:.2f}\n"
-                f"📊 Quantity: {quantity:.6f}\n"
-                f"🆔 Order ID: {order_id}\n"
+            message = _MSG_HEADER.format(
+                direction=direction, symbol=symbol, price=price,
+                quantity=quantity, order_id=order_id
             )
-            
+
             if tp_sl_data:
                 tp_price = tp_sl_data['tp_price']
                 sl_price = tp_sl_data['sl_price']
-                
+
                 if direction == 'LONG':
                     tp_pct = ((tp_price - price) / price) * 100
                     sl_pct = ((price - sl_price) / price) * 100
                 else:
                     tp_pct = ((price - tp_price) / price) * 100
                     sl_pct = ((sl_price - price) / price) * 100
-                
-                message += (
-                    f"🎯 Take Profit: ${tp_price:.2f} (+{tp_pct:.1f}%)\n"
-                    f"🛡️ Stop Loss: ${sl_price:.2f} (-{sl_pct:.1f}%)\n"
+
+                message += _MSG_TPSL.format(
+                    tp_price=tp_price, tp_pct=tp_pct,
+                    sl_price=sl_price, sl_pct=sl_pct
                 )
             
-            asyncio.run(self.send_telegram_notification(message))
-            
+            # Fire-and-forget: schedule on the background loop and return immediately
+            self.send_notification_threadsafe(message)
+
         except Exception as e:
             logger.error(f"Error sending notification: {str(e)}")
+
+    def send_notification_threadsafe(self, message, timeout=None):
+        """Schedule a Telegram notification on the background event loop
+
+        Callers on any thread use this instead of spinning up their own
+        event loop per message.
+
+        Args:
+            message (str): Message to send
+            timeout (float, optional): Seconds to wait for the send to
+                complete; None returns immediately (fire-and-forget)
+
+        Returns:
+            bool: True if scheduled (and, with a timeout, completed)
+        """
+        try:
+            if timeout is None:
+                # Fire-and-forget goes through the coalescing queue so bursts
+                # collapse into one Telegram round-trip
+                self._notif_loop.call_soon_threadsafe(
+                    self._notif_queue.put_nowait, message
+                )
+                return True
+
+            future = asyncio.run_coroutine_threadsafe(
+                self.send_telegram_notification(message), self._notif_loop
+            )
+            future.result(timeout)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send Telegram notification: {str(e)}")
+            return False
+
+    async def _notification_flush_loop(self):
+        """Drain queued notifications and send each burst as one message
+
+        Bursts are packed into as few messages as fit under Telegram's
+        4096-character limit - one oversize join would be rejected by the
+        API and drop every notification in the batch.
+        """
+        separator = "\n\n---\n\n"
+        while True:
+            try:
+                batch = [await self._notif_queue.get()]
+                # Give a burst a moment to accumulate before flushing
+                await asyncio.sleep(0.5)
+                while not self._notif_queue.empty():
+                    batch.append(self._notif_queue.get_nowait())
+
+                chunk = ""
+                for item in batch:
+                    # Hard-split a single oversize message too
+                    while len(item) > _TG_MESSAGE_LIMIT:
+                        if chunk:
+                            await self.send_telegram_notification(chunk)
+                            chunk = ""
+                        await self.send_telegram_notification(item[:_TG_MESSAGE_LIMIT])
+                        item = item[_TG_MESSAGE_LIMIT:]
+                    candidate = chunk + separator + item if chunk else item
+                    if len(candidate) > _TG_MESSAGE_LIMIT:
+                        await self.send_telegram_notification(chunk)
+                        chunk = item
+                    else:
+                        chunk = candidate
+                if chunk:
+                    await self.send_telegram_notification(chunk)
+            except Exception as e:
+                logger.error(f"Notification flush failed: {str(e)}")
     
     async def send_telegram_notification(self, message):
         """Send Telegram notification
@@ -778,19 +1855,46 @@ class BinanceHandler:
         Args:
             message (str): Message to send
         """
-        if self.config.get('telegram_bot_token') and self.config.get('telegram_chat_id'):
+        if self.config.get('telegram_bot_token') and self._tg_chat_id:
             try:
-                from telegram import Bot
-                bot = Bot(token=self.config['telegram_bot_token'])
-                
-                chat_id = self.config['telegram_chat_id']
-                if chat_id.isdigit() and chat_id.startswith("100"):
-                    chat_id = "-" + chat_id
-                
-                await bot.send_message(chat_id=chat_id, text=message)
+                # Reuse one Bot - its httpx client keeps a warm connection to
+                # api.telegram.org instead of a TLS handshake per message
+                if self._tg_bot is None:
+                    from telegram import Bot
+                    self._tg_bot = Bot(token=self.config['telegram_bot_token'])
+
+                # Smooth the send rate so bursts never trip the per-chat limit
+                await self._acquire_tg_token()
+
+                try:
+                    await self._tg_bot.send_message(chat_id=self._tg_chat_id, text=message)
+                except Exception as send_err:
+                    # Flood control: honor the server's retry_after once
+                    retry_after = getattr(send_err, 'retry_after', None)
+                    if retry_after is None:
+                        raise
+                    logger.warning(f"⚠️ Telegram flood control, retrying in {retry_after}s")
+                    await asyncio.sleep(float(retry_after))
+                    await self._tg_bot.send_message(chat_id=self._tg_chat_id, text=message)
+
                 logger.info("Telegram notification sent")
             except Exception as e:
                 logger.error(f"Failed to send Telegram notification: {str(e)}")
+
+    async def _acquire_tg_token(self):
+        """Wait for a Telegram send token (1/s refill, burst capacity 5)
+
+        Runs only on the notification loop, so plain attribute updates are
+        safe without a lock.
+        """
+        while True:
+            now = time.monotonic()
+            self._tg_tokens = min(5.0, self._tg_tokens + (now - self._tg_tokens_ts))
+            self._tg_tokens_ts = now
+            if self._tg_tokens >= 1.0:
+                self._tg_tokens -= 1.0
+                return
+            await asyncio.sleep(1.0 - self._tg_tokens)
     
     def place_trailing_stop_strategy(self, data: dict) -> dict:
         """
@@ -806,19 +1910,28 @@ class BinanceHandler:
             dict: Success/error status with order IDs
         """
         try:
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("🚀 TRAILING STOP STRATEGY - STARTING")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             
             # ====================================================================
             # STEP 1: PARSE & VALIDATE PAYLOAD
             # ====================================================================
-            symbol = data.get('symbol', '').upper().strip()
-            side = data.get('side', '').upper().strip()
-            action = data.get('action', '').lower().strip()
-            quantity_str = data.get('quantity')  # Will be set from coin_config if None
-            working_type = data.get('workingType', 'MARK_PRICE').upper()
-            
+            # Single pass over the payload - one dict probe per field instead
+            # of scattered data.get() lookups through the parsing steps below
+            (symbol, side, action, quantity_str, working_type,
+             callback_rate_raw, activation_price_raw,
+             stop_loss_raw, take_profit_raw) = (
+                data.get(k) for k in (
+                    'symbol', 'side', 'action', 'quantity', 'workingType',
+                    'callbackRate', 'activationPrice', 'stopLoss', 'takeProfit'))
+
+            symbol = (symbol or '').upper().strip()
+            side = (side or '').upper().strip()
+            action = (action or '').lower().strip()
+            # quantity_str will be set from coin_config if None
+            working_type = (working_type or 'MARK_PRICE').upper()
+
             # Validate required fields
             if not symbol:
                 return {"success": False, "error": "Missing required field: symbol"}
@@ -828,10 +1941,9 @@ class BinanceHandler:
                 return {"success": False, "error": f"Invalid action: {action}. Must be 'open'"}
             if working_type not in ['MARK_PRICE', 'CONTRACT_PRICE']:
                 working_type = 'MARK_PRICE'
-                logger.warning(f"Invalid workingType, defaulting to MARK_PRICE")
-            
+                logger.warning("Invalid workingType, defaulting to MARK_PRICE")
+
             # Parse callbackRate (support string, float, and % sign)
-            callback_rate_raw = data.get('callbackRate')
             if callback_rate_raw is None:
                 return {"success": False, "error": "Missing required field: callbackRate"}
             
@@ -846,101 +1958,105 @@ class BinanceHandler:
             # CRITICAL: Binance Algo Order API requires callbackRate between 0.1 and 5.0
             # Also round to 1 decimal place to avoid "Invalid callBack rate" error
             if callback_rate < 0.1:
-                logger.warning(f"⚠️ callbackRate {callback_rate}% is below minimum 0.1%, adjusting to 0.1%")
+                logger.warning("⚠️ callbackRate %s%% is below minimum 0.1%%, adjusting to 0.1%%", callback_rate)
                 callback_rate = 0.1
             elif callback_rate > 5.0:
-                logger.warning(f"⚠️ callbackRate {callback_rate}% is above maximum 5.0%, adjusting to 5.0%")
+                logger.warning("⚠️ callbackRate %s%% is above maximum 5.0%%, adjusting to 5.0%%", callback_rate)
                 callback_rate = 5.0
             
             # Round to 1 decimal place for Binance API compatibility
             callback_rate = round(callback_rate, 1)
             
-            # Parse activationPrice (optional - auto-calculated if None/0.0/invalid)
-            activation_price_raw = data.get('activationPrice')
-            activation_price = None
-            if activation_price_raw is not None:
-                try:
-                    activation_price = float(activation_price_raw)
-                    if activation_price <= 0:
-                        activation_price = None
-                except (TypeError, ValueError):
-                    activation_price = None
-            
-            # Parse stopLoss (optional - auto-calculated if None/0.0/invalid)
-            stop_loss_raw = data.get('stopLoss')
-            stop_loss_price = None
-            if stop_loss_raw is not None:
-                try:
-                    stop_loss_price = float(stop_loss_raw)
-                    if stop_loss_price <= 0:
-                        stop_loss_price = None
-                except (TypeError, ValueError):
-                    stop_loss_price = None
-            
-            # Parse takeProfit (optional - used in fallback if trailing stop fails)
-            take_profit_raw = data.get('takeProfit')
-            take_profit_price = None
-            if take_profit_raw is not None:
+            # Optional prices share the same None/0.0/invalid handling
+            def _optional_price(raw):
+                if raw is None:
+                    return None
                 try:
-                    take_profit_price = float(take_profit_raw)
-                    if take_profit_price <= 0:
-                        take_profit_price = None
+                    value = float(raw)
                 except (TypeError, ValueError):
-                    take_profit_price = None
-            
+                    return None
+                return value if value > 0 else None
+
+            # activationPrice / stopLoss: auto-calculated if None/0.0/invalid
+            # takeProfit: used in fallback only if trailing stop fails
+            activation_price = _optional_price(activation_price_raw)
+            stop_loss_price = _optional_price(stop_loss_raw)
+            take_profit_price = _optional_price(take_profit_raw)
+
             formatted_symbol = self._format_symbol(symbol)
             direction = 'long' if side == 'BUY' else 'short'
-            position_side = 'LONG' if direction == 'long' else 'SHORT'
+            dir_cfg = _DIR_TABLE[direction]
+            position_side = dir_cfg['position_side']
             
             # ====================================================================
             # STEP 2: CHECK TRADING PERMISSIONS
             # ====================================================================
             # Check if trading is enabled globally
-            if not self.config.get('enable_trading', False):
+            if not self._enable_trading:
                 logger.warning("❌ Trading is disabled globally")
                 return {"success": False, "error": "Trading is disabled globally"}
             
             # Check coin-specific trading status
             if not self.coin_config_manager.is_trading_enabled(formatted_symbol):
-                logger.warning(f"❌ Trading is disabled for {formatted_symbol}")
+                logger.warning("❌ Trading is disabled for %s", formatted_symbol)
                 return {"success": False, "error": f"Trading is disabled for {formatted_symbol}"}
             
             # ====================================================================
             # STEP 3: SETUP LEVERAGE & MARGIN
             # ====================================================================
             coin_config = self.coin_config_manager.get_coin_config(formatted_symbol)
-            self.set_leverage(formatted_symbol, coin_config['leverage'])
-            self.set_margin_type(formatted_symbol, 'CROSSED')
+            # Same preflight fan-out as place_order: leverage/margin (skipped
+            # when the last applied state matches), balance and positions are
+            # independent round-trips, so pay max(t) instead of the sum
+            margin_asset = self._get_margin_asset(formatted_symbol)
+            leverage_future = None
+            margin_future = None
+            if self._leverage_state.get(formatted_symbol) != coin_config['leverage']:
+                leverage_future = self._http_pool.submit(self.set_leverage, formatted_symbol, coin_config['leverage'])
+            if self._margin_state.get(formatted_symbol) != 'CROSSED':
+                margin_future = self._http_pool.submit(self.set_margin_type, formatted_symbol, 'CROSSED')
+            balance_future = self._http_pool.submit(self.get_account_balance, margin_asset)
+            positions_future = self._http_pool.submit(self.get_open_positions)
+            # Only remember state on success so failures are retried next order
+            if leverage_future is not None and leverage_future.result() is not None:
+                self._leverage_state[formatted_symbol] = coin_config['leverage']
+            if margin_future is not None and margin_future.result() is not None:
+                self._margin_state[formatted_symbol] = 'CROSSED'
             
             # If quantity not provided, use coin config's order_size_percentage
             if quantity_str is None or quantity_str == '':
                 order_size_pct = coin_config.get('order_size_percentage', 10.0)
                 quantity_str = f"{order_size_pct}%"
-                logger.info(f"📊 Quantity not provided, using coin config: {quantity_str}")
-            
-            logger.info(f"📋 Parsed Parameters:")
-            logger.info(f"   Symbol: {formatted_symbol}")
-            logger.info(f"   Side: {side} ({direction})")
-            logger.info(f"   Quantity: {quantity_str}")
-            logger.info(f"   Callback Rate: {callback_rate}%")
-            logger.info(f"   Activation Price: {activation_price or 'Auto-calculate'}")
-            logger.info(f"   Stop Loss: {stop_loss_price or 'Auto-calculate'}")
-            logger.info(f"   Take Profit: {take_profit_price or 'Auto-calculate (fallback only)'}")
-            logger.info(f"   Working Type: {working_type}")
+                logger.info("📊 Quantity not provided, using coin config: %s", quantity_str)
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📋 Parsed Parameters:")
+                logger.info("   Symbol: %s", formatted_symbol)
+                logger.info("   Side: %s (%s)", side, direction)
+                logger.info("   Quantity: %s", quantity_str)
+                logger.info("   Callback Rate: %s%%", callback_rate)
+                logger.info("   Activation Price: %s", activation_price or 'Auto-calculate')
+                logger.info("   Stop Loss: %s", stop_loss_price or 'Auto-calculate')
+                logger.info("   Take Profit: %s", take_profit_price or 'Auto-calculate (fallback only)')
+                logger.info("   Working Type: %s", working_type)
             
             # ====================================================================
             # STEP 4: CHECK EXISTING POSITIONS (WITH AUTO SWITCH)
             # ====================================================================
-            current_positions = self.get_open_positions()
-            
+            current_positions = positions_future.result()
+
             # Use position validator to check for duplicate/opposite positions
-            auto_switch_enabled = self.config.get('auto_position_switch', True)
-            validation_result = self.position_validator.validate_position_request(
-                formatted_symbol, direction, action, current_positions, auto_switch_enabled
-            )
+            # (skipped when the account is flat - nothing to conflict with)
+            auto_switch_enabled = self._auto_position_switch
+            if not current_positions:
+                validation_result = {'allowed': True}
+            else:
+                validation_result = self.position_validator.validate_position_request(
+                    formatted_symbol, direction, action, current_positions, auto_switch_enabled
+                )
             
             if not validation_result['allowed']:
-                logger.warning(f"❌ Position request REJECTED: {validation_result['reason']}")
+                logger.warning("❌ Position request REJECTED: %s", validation_result['reason'])
                 return {"success": False, "error": validation_result['reason']}
             
             # Handle required actions (e.g., close opposite position)
@@ -952,11 +2068,14 @@ class BinanceHandler:
                     positions_to_close = validation_result['action_required']['positions_to_close']
                     
                     for pos in positions_to_close:
-                        close_side = f"close_{pos['side']}"
-                        close_result = self.place_order(formatted_symbol, close_side, quantity=pos['size'])
-                        
+                        # Direct close - skips the full place_order setup
+                        close_binance_side = 'SELL' if pos['side'] == 'long' else 'BUY'
+                        close_result = self._execute_raw_order(
+                            formatted_symbol, close_binance_side, pos['side'].upper(), pos['size']
+                        )
+
                         if not close_result or 'error' in close_result:
-                            logger.error(f"❌ Failed to close opposite position: {close_result.get('error', 'Unknown error')}")
+                            logger.error("❌ Failed to close opposite position: %s", close_result.get('error', 'Unknown error'))
                             return {"success": False, "error": "Failed to close opposite position"}
                     
                     logger.info("✅ Opposite position closed successfully")
@@ -967,9 +2086,13 @@ class BinanceHandler:
             # ====================================================================
             # STEP 5: CALCULATE QUANTITY
             # ====================================================================
-            margin_asset = self._get_margin_asset(formatted_symbol)
-            available_balance, total_balance, unrealized_pnl = self.get_account_balance(margin_asset)
-            
+            if validation_result.get('action_required'):
+                # Closing the opposite position freed margin - the balance
+                # fetched in the preflight fan-out is stale, take a fresh one
+                available_balance, total_balance, unrealized_pnl = self.get_account_balance(margin_asset)
+            else:
+                available_balance, total_balance, unrealized_pnl = balance_future.result()
+
             if available_balance <= 0:
                 logger.warning("Zero available balance, using dummy value for testing")
                 available_balance = 1000.0
@@ -979,38 +2102,21 @@ class BinanceHandler:
                 return {"success": False, "error": "Failed to get current price"}
             
             # Parse quantity (support percentage string like "10%" or float)
-            if isinstance(quantity_str, str) and quantity_str.endswith('%'):
-                quantity_percentage = float(quantity_str.replace('%', ''))
-                order_amount = available_balance * (quantity_percentage / 100)
-                leveraged_amount = order_amount * coin_config['leverage']
-                quantity = leveraged_amount / current_price
-            else:
-                try:
-                    quantity = float(quantity_str)
-                except (TypeError, ValueError):
-                    # Default to coin config's order_size_percentage if invalid
-                    order_size_pct = coin_config.get('order_size_percentage', 10.0)
-                    order_amount = available_balance * (order_size_pct / 100)
-                    leveraged_amount = order_amount * coin_config['leverage']
-                    quantity = leveraged_amount / current_price
-                    logger.warning(f"⚠️ Invalid quantity format '{quantity_str}', using coin config: {order_size_pct}%")
-            
-            logger.info(f"📊 Quantity Calculation:")
-            logger.info(f"   Balance: ${available_balance:.2f} {margin_asset}")
-            logger.info(f"   Quantity Input: {quantity_str}")
-            logger.info(f"   Current Price: ${current_price:.2f}")
-            logger.info(f"   Leverage: {coin_config['leverage']}x")
-            logger.info(f"   Order Size %: {coin_config.get('order_size_percentage', 'N/A')}%")
-            
-            # Calculate order amount details for logging
-            if isinstance(quantity_str, str) and quantity_str.endswith('%'):
-                quantity_percentage = float(quantity_str.replace('%', ''))
-                order_amount = available_balance * (quantity_percentage / 100)
-                leveraged_amount = order_amount * coin_config['leverage']
-                logger.info(f"   Order Amount: ${order_amount:.2f} ({quantity_percentage}% of balance)")
-                logger.info(f"   Leveraged Amount: ${leveraged_amount:.2f} ({coin_config['leverage']}x)")
-            
-            logger.info(f"   Calculated Quantity: {quantity:.8f}")
+            quantity, order_amount, leveraged_amount, quantity_pct = self._resolve_quantity(
+                quantity_str, available_balance, current_price, coin_config
+            )
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 Quantity Calculation:")
+                logger.info("   Balance: $%.2f %s", available_balance, margin_asset)
+                logger.info("   Quantity Input: %s", quantity_str)
+                logger.info("   Current Price: $%.2f", current_price)
+                logger.info("   Leverage: %sx", coin_config['leverage'])
+                logger.info("   Order Size %%: %s%%", coin_config.get('order_size_percentage', 'N/A'))
+                if quantity_pct is not None:
+                    logger.info("   Order Amount: $%.2f (%s%% of balance)", order_amount, quantity_pct)
+                    logger.info("   Leveraged Amount: $%.2f (%sx)", leveraged_amount, coin_config['leverage'])
+                logger.info("   Calculated Quantity: %.8f", quantity)
             
             # Validate quantity before formatting
             if quantity <= 0:
@@ -1022,14 +2128,14 @@ class BinanceHandler:
             # ====================================================================
             # STEP 6: PLACE ENTRY ORDER (MARKET)
             # ====================================================================
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("📤 STEP 6: PLACING ENTRY ORDER (MARKET)")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             
             # Format quantity according to Binance precision requirements
             try:
                 quantity = self._format_quantity(formatted_symbol, quantity)
-                logger.info(f"✅ Formatted quantity: {quantity:.8f}")
+                logger.info("✅ Formatted quantity: %.8f", quantity)
             except ValueError as ve:
                 error_msg = f"Quantity formatting failed: {str(ve)}. Calculated quantity was too small."
                 logger.error(f"❌ {error_msg}")
@@ -1039,25 +2145,29 @@ class BinanceHandler:
             # Check position mode BEFORE placing entry order
             is_one_way_mode_entry = True
             try:
-                # Use futures_get_position_mode() if available, otherwise check positions
+                # Use the cached position mode if available, otherwise check positions
                 try:
-                    position_mode = self.client.futures_get_position_mode()
-                    is_one_way_mode_entry = not position_mode.get('dualSidePosition', False)
-                    logger.info(f"📌 Entry Order: Position mode API check - One-way: {is_one_way_mode_entry}")
+                    is_one_way_mode_entry = self._is_one_way_mode()
+                    logger.info("📌 Entry Order: Position mode API check - One-way: %s", is_one_way_mode_entry)
                 except:
                     # Fallback: check existing positions
-                    positions = self.client.futures_position_information()
-                    for pos in positions:
-                        if pos.get('symbol') == formatted_symbol:
-                            pos_side = pos.get('positionSide', 'BOTH')
-                            if pos_side != 'BOTH':
-                                is_one_way_mode_entry = False
-                                break
-                    logger.info(f"📌 Entry Order: Position mode from positions - One-way: {is_one_way_mode_entry}")
+                    for pos in self._position_info_by_symbol().get(formatted_symbol, ()):
+                        if pos.get('positionSide', 'BOTH') != 'BOTH':
+                            is_one_way_mode_entry = False
+                            break
+                    logger.info("📌 Entry Order: Position mode from positions - One-way: %s", is_one_way_mode_entry)
             except Exception as e:
                 logger.warning(f"Could not check position mode for entry order: {str(e)}, assuming one-way mode")
                 is_one_way_mode_entry = True
             
+            # ATR is only needed for the auto stop loss and depends on klines,
+            # not on the entry fill - overlap the fetch with the entry order
+            atr_future = None
+            if stop_loss_price is None:
+                atr_future = self._http_pool.submit(
+                    self.get_atr, formatted_symbol, self.tp_sl_manager.get_atr_period(symbol)
+                )
+
             try:
                 entry_params = {
                     'symbol': formatted_symbol,
@@ -1070,33 +2180,43 @@ class BinanceHandler:
                 # In ONE-WAY mode, positionSide must NOT be included (causes API error)
                 if not is_one_way_mode_entry:
                     entry_params['positionSide'] = position_side
-                    logger.info(f"📌 Entry Order: Hedge mode - adding positionSide: {position_side}")
+                    logger.info("📌 Entry Order: Hedge mode - adding positionSide: %s", position_side)
                 else:
-                    logger.info(f"📌 Entry Order: One-way mode - NOT adding positionSide")
+                    logger.info("📌 Entry Order: One-way mode - NOT adding positionSide")
                 
-                logger.info(f"📋 Entry Order Parameters:")
-                for key, value in entry_params.items():
-                    logger.info(f"   {key}: {value}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📋 Entry Order Parameters:")
+                    for key, value in entry_params.items():
+                        logger.info("   %s: %s", key, value)
                 
                 entry_order = self.client.futures_create_order(**entry_params)
-                
+
                 entry_order_id = entry_order.get('orderId')
-                
+
+                # MARKET responses often carry avgPrice="0" - the real fill
+                # arrives on the user-data stream within milliseconds, so wait
+                # for the ORDER_TRADE_UPDATE event instead of sleeping and
+                # polling the position endpoint below
+                fill = self._await_fill(entry_order_id)
+                entry_fill_qty = fill[1] if fill is not None and fill[1] > 0 else None
+                if fill is not None:
+                    logger.info("📡 Entry fill from user stream: $%.4f (qty %s)", fill[0], fill[1])
+
                 # Get entry price from order response (avgPrice may not be available immediately)
                 avg_price = entry_order.get('avgPrice')
                 if avg_price and float(avg_price) > 0:
                     entry_price = float(avg_price)
+                elif fill is not None and fill[0] > 0:
+                    entry_price = fill[0]
                 else:
-                    # Wait a bit for order to fill, then use current price
-                    time.sleep(0.5)
-                    entry_price = self.get_symbol_price(formatted_symbol)
-                    if entry_price <= 0:
-                        entry_price = current_price
+                    # Reuse the price fetched during sizing - another REST call
+                    # after a short sleep returned the same near-realtime value
+                    entry_price = current_price
                 
-                logger.info(f"✅ Entry order placed successfully!")
-                logger.info(f"   Order ID: {entry_order_id}")
-                logger.info(f"   Entry Price: ${entry_price:.2f}")
-                logger.info(f"   Quantity: {quantity:.6f}")
+                logger.info("✅ Entry order placed successfully!")
+                logger.info("   Order ID: %s", entry_order_id)
+                logger.info("   Entry Price: $%.2f", entry_price)
+                logger.info("   Quantity: %.6f", quantity)
                 
                 # Validate entry price
                 if entry_price <= 0:
@@ -1111,50 +2231,40 @@ class BinanceHandler:
             # STEP 7: CALCULATE AUTO-PRICES (if needed)
             # ====================================================================
             if activation_price is None:
-                if direction == 'long':
-                    activation_price = entry_price * 1.02  # 2% above entry
-                else:
-                    activation_price = entry_price * 0.98  # 2% below entry
+                activation_price = entry_price * dir_cfg['activation_mult']
                 # Format activation price precision
                 activation_price = self.tp_sl_manager._round_to_price_step(formatted_symbol, activation_price)
-                logger.info(f"🔄 Auto-calculated activation price: ${activation_price:.2f}")
+                logger.info("🔄 Auto-calculated activation price: $%.2f", activation_price)
             
             if stop_loss_price is None:
-                # Use config ATR period + SL multiplier (same as tony_web_app)
-                atr_period = self.tp_sl_manager.get_atr_period(symbol)
-                atr_value = self.get_atr(formatted_symbol, atr_period)
+                # Use config ATR period + SL multiplier (same as tony_web_app);
+                # the fetch ran concurrently with the entry order above
+                atr_value = atr_future.result()
                 if atr_value and atr_value > 0:
                     _, stop_loss_price = self.tp_sl_manager.calculate_tp_sl_prices(
                         symbol, entry_price, atr_value, direction
                     )
-                    logger.info(f"🔄 ATR-based stop loss: ${stop_loss_price:.2f} (ATR={atr_value:.4f}, config sl_mult)")
+                    logger.info("🔄 ATR-based stop loss: $%.2f (ATR=%.4f, config sl_mult)", stop_loss_price, atr_value)
                 else:
                     # Fallback when ATR unavailable
-                    sl_pct = 0.03
-                    if direction == 'long':
-                        stop_loss_price = entry_price * (1 - sl_pct)
-                    else:
-                        stop_loss_price = entry_price * (1 + sl_pct)
+                    stop_loss_price = entry_price * dir_cfg['stop_loss_mult']
                     stop_loss_price = self.tp_sl_manager._round_to_price_step(formatted_symbol, stop_loss_price)
-                    logger.warning(f"🔄 Fallback stop loss (ATR unavailable): ${stop_loss_price:.2f} (±{sl_pct*100:.0f}%)")
+                    logger.warning("🔄 Fallback stop loss (ATR unavailable): $%.2f (±3%%)", stop_loss_price)
             else:
                 # Format provided stop loss price precision
                 stop_loss_price = self.tp_sl_manager._round_to_price_step(formatted_symbol, stop_loss_price)
-                logger.info(f"🔄 Using provided stop loss: ${stop_loss_price:.2f}")
+                logger.info("🔄 Using provided stop loss: $%.2f", stop_loss_price)
             
             # Calculate take profit if not provided (for fallback only)
             if take_profit_price is None:
-                if direction == 'long':
-                    take_profit_price = entry_price * 1.05  # 5% above entry
-                else:
-                    take_profit_price = entry_price * 0.95  # 5% below entry
+                take_profit_price = entry_price * dir_cfg['take_profit_mult']
                 # Format take profit price precision
                 take_profit_price = self.tp_sl_manager._round_to_price_step(formatted_symbol, take_profit_price)
-                logger.info(f"🔄 Auto-calculated take profit (fallback): ${take_profit_price:.2f}")
+                logger.info("🔄 Auto-calculated take profit (fallback): $%.2f", take_profit_price)
             else:
                 # Format provided take profit price precision
                 take_profit_price = self.tp_sl_manager._round_to_price_step(formatted_symbol, take_profit_price)
-                logger.info(f"🔄 Using provided take profit (fallback): ${take_profit_price:.2f}")
+                logger.info("🔄 Using provided take profit (fallback): $%.2f", take_profit_price)
             
             # Format activation price precision if provided
             if activation_price is not None:
@@ -1163,11 +2273,11 @@ class BinanceHandler:
             # ====================================================================
             # STEP 8: PLACE TRAILING STOP ORDER (with retry)
             # ====================================================================
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("📤 STEP 8: PLACING TRAILING STOP ORDER")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             
-            trailing_stop_side = 'SELL' if direction == 'long' else 'BUY'
+            trailing_stop_side = dir_cfg['close_side']
             trailing_stop_id = None
             trailing_stop_success = False
             
@@ -1178,34 +2288,43 @@ class BinanceHandler:
             # Use the same mode as entry order (already checked above)
             is_one_way_mode = is_one_way_mode_entry
             
-            # Wait for position to be established after entry order
-            logger.info("⏳ Waiting for position to be established after entry order...")
-            time.sleep(1.0)  # Give Binance time to process the entry order
-            
-            # Verify position exists and get position size before placing trailing stop
+            # Verify position exists and get position size before placing the
+            # trailing stop. When the user stream already confirmed the entry
+            # fill the position is established - skip the settle sleep and the
+            # position poll entirely.
             position_size = 0.0
-            try:
-                positions = self.client.futures_position_information()
-                position_exists = False
-                for pos in positions:
-                    if pos.get('symbol') == formatted_symbol:
-                        pos_amt = abs(float(pos.get('positionAmt', '0')))
-                        if pos_amt > 0:
-                            position_exists = True
-                            position_size = pos_amt
-                            logger.info(f"✅ Position verified: {formatted_symbol} | Size: {pos_amt} | Side: {pos.get('positionSide', 'BOTH')}")
+            if entry_fill_qty:
+                position_size = entry_fill_qty
+                logger.info("✅ Position confirmed via entry fill event: %s | Size: %s", formatted_symbol, position_size)
+            else:
+                # Hot-then-backoff probe: most market entries settle well
+                # under a second, so check quickly at first and stretch the
+                # interval instead of paying a flat 1s sleep on every trade
+                logger.info("⏳ Waiting for position to be established after entry order...")
+                try:
+                    position_exists = False
+                    for delay in (0.05, 0.1, 0.2, 0.3, 0.5, 0.85):
+                        time.sleep(delay)
+                        for pos in self._position_info_by_symbol(max_age=0.0).get(formatted_symbol, ()):
+                            pos_amt = abs(float(pos.get('positionAmt', '0')))
+                            if pos_amt > 0:
+                                position_exists = True
+                                position_size = pos_amt
+                                logger.info("✅ Position verified: %s | Size: %s | Side: %s", formatted_symbol, pos_amt, pos.get('positionSide', 'BOTH'))
+                                break
+                        if position_exists:
                             break
-                
-                if not position_exists:
-                    logger.error(f"❌ CRITICAL: Position not found for {formatted_symbol} after entry order!")
-                    logger.error(f"   This will cause trailing stop order to fail.")
-                    logger.error(f"   Entry order may not have been filled yet.")
-            except Exception as e:
-                logger.error(f"❌ Could not verify position: {str(e)}")
+
+                    if not position_exists:
+                        logger.error("❌ CRITICAL: Position not found for %s after entry order!", formatted_symbol)
+                        logger.error("   This will cause trailing stop order to fail.")
+                        logger.error("   Entry order may not have been filled yet.")
+                except Exception as e:
+                    logger.error("❌ Could not verify position: %s", str(e))
             
             for attempt in range(max_retries):
                 try:
-                    logger.info(f"🔄 Attempt {attempt + 1}/{max_retries}...")
+                    logger.info("🔄 Attempt %s/%s...", attempt + 1, max_retries)
                     
                     # CRITICAL FIX: Binance API error -4136: "Target strategy invalid for orderType TRAILING_STOP_MARKET,closePosition true"
                     # Solution: Use quantity instead of closePosition for TRAILING_STOP_MARKET orders
@@ -1225,18 +2344,19 @@ class BinanceHandler:
                     # In ONE-WAY mode, positionSide must NOT be included (causes API error)
                     if not is_one_way_mode:
                         trailing_params['positionSide'] = position_side
-                        logger.info(f"📌 Hedge mode detected - adding positionSide: {position_side}")
+                        logger.info("📌 Hedge mode detected - adding positionSide: %s", position_side)
                     else:
-                        logger.info(f"📌 One-way mode detected - NOT adding positionSide")
+                        logger.info("📌 One-way mode detected - NOT adding positionSide")
                     
-                    logger.info(f"📋 Trailing Stop Parameters:")
-                    for key, value in trailing_params.items():
-                        logger.info(f"   {key}: {value}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("📋 Trailing Stop Parameters:")
+                        for key, value in trailing_params.items():
+                            logger.info("   %s: %s", key, value)
                     
                     # CRITICAL FIX: Use Algo Order API for TRAILING_STOP_MARKET
                     # Error -4120: "Order type not supported for this endpoint. Please use the Algo Order API endpoints instead."
                     # Solution: Use futures_create_algo_order (requires python-binance >= 1.0.34)
-                    logger.info(f"🔧 Using Algo Order API (futures_create_algo_order) for TRAILING_STOP_MARKET")
+                    logger.info("🔧 Using Algo Order API (futures_create_algo_order) for TRAILING_STOP_MARKET")
                     trailing_order = self.client.futures_create_algo_order(**trailing_params)
                     
                     # CRITICAL: Binance returns algoId for TRAILING_STOP_MARKET orders, not orderId
@@ -1250,10 +2370,10 @@ class BinanceHandler:
                     else:
                         algo_type = trailing_order.get('algoType', 'N/A')
                         algo_status = trailing_order.get('algoStatus', 'N/A')
-                        logger.info(f"✅ Trailing stop order placed successfully!")
-                        logger.info(f"   Algo ID: {trailing_stop_id}")
-                        logger.info(f"   Algo Type: {algo_type}")
-                        logger.info(f"   Algo Status: {algo_status}")
+                        logger.info("✅ Trailing stop order placed successfully!")
+                        logger.info("   Algo ID: %s", trailing_stop_id)
+                        logger.info("   Algo Type: %s", algo_type)
+                        logger.info("   Algo Status: %s", algo_status)
                         
                         # Track trailing stop for cleanup when position closes
                         tracking_key = f"{formatted_symbol}_{position_side}"
@@ -1262,7 +2382,7 @@ class BinanceHandler:
                         if tracking_key not in self.trailing_stop_tracking:
                             self.trailing_stop_tracking[tracking_key] = []
                         self.trailing_stop_tracking[tracking_key].append(trailing_stop_id)
-                        logger.info(f"📝 Trailing stop tracked for cleanup: {tracking_key}")
+                        logger.info("📝 Trailing stop tracked for cleanup: %s", tracking_key)
                     
                     trailing_stop_success = True
                     break
@@ -1283,30 +2403,34 @@ class BinanceHandler:
                     
                     # Log position information for debugging
                     try:
-                        positions = self.client.futures_position_information()
-                        for pos in positions:
-                            if pos.get('symbol') == formatted_symbol:
-                                pos_amt = abs(float(pos.get('positionAmt', '0')))
-                                if pos_amt > 0:
-                                    logger.error(f"   Current Position: {formatted_symbol} | Size: {pos_amt} | Side: {pos.get('positionSide', 'BOTH')}")
-                                    break
+                        for pos in self._position_info_by_symbol().get(formatted_symbol, ()):
+                            pos_amt = abs(float(pos.get('positionAmt', '0')))
+                            if pos_amt > 0:
+                                logger.error("   Current Position: %s | Size: %s | Side: %s", formatted_symbol, pos_amt, pos.get('positionSide', 'BOTH'))
+                                break
                     except Exception as pos_e:
                         logger.error(f"   Could not check position: {str(pos_e)}")
                     
                     # Log position mode
                     logger.error(f"   Position Mode: {'ONE-WAY' if is_one_way_mode else 'HEDGE'}")
-                    
+
+                    # Parameter/endpoint errors cannot succeed on retry -
+                    # go straight to the fallback TP/SL instead of burning
+                    # up to 1.5s of backoff on a permanent failure
+                    if error_code in _FATAL_ALGO_ERRORS:
+                        logger.error("❌ Error %s is permanent - skipping retries, using fallback TP/SL", error_code)
+                        trailing_stop_success = False
+                        break
+
                     if attempt < max_retries - 1:
                         delay = retry_delays[attempt]
-                        logger.info(f"⏳ Retrying in {delay}s...")
+                        logger.info("⏳ Retrying in %ss...", delay)
                         time.sleep(delay)
                     else:
                         logger.error(f"❌ All {max_retries} attempts failed. Last error: {error_msg} (Code: {error_code})")
                         trailing_stop_success = False
                 except Exception as e:
-                    import traceback
-                    logger.error(f"❌ Unexpected error in attempt {attempt + 1}: {str(e)}")
-                    logger.error(f"   Traceback: {traceback.format_exc()}")
+                    logger.error(f"❌ Unexpected error in attempt {attempt + 1}: {str(e)}", exc_info=True)
                     logger.error(f"   Parameters used:")
                     for key, value in trailing_params.items():
                         logger.error(f"      {key}: {value}")
@@ -1321,86 +2445,80 @@ class BinanceHandler:
             # STEP 9: FALLBACK - PLACE TP/SL (if trailing stop failed)
             # ====================================================================
             if not trailing_stop_success:
-                logger.info("=" * 80)
+                logger.info(_BANNER)
                 logger.info("⚠️ STEP 9: TRAILING STOP FAILED - PLACING FALLBACK TP/SL")
-                logger.info("=" * 80)
+                logger.info(_BANNER)
                 
                 # Re-check position mode for fallback (may have changed)
                 is_one_way_mode_fallback = True
                 try:
-                    positions = self.client.futures_position_information()
-                    for pos in positions:
-                        if pos.get('symbol') == formatted_symbol:
-                            pos_side = pos.get('positionSide', 'BOTH')
-                            if pos_side != 'BOTH':
-                                is_one_way_mode_fallback = False
-                                break
+                    for pos in self._position_info_by_symbol().get(formatted_symbol, ()):
+                        if pos.get('positionSide', 'BOTH') != 'BOTH':
+                            is_one_way_mode_fallback = False
+                            break
                 except Exception as e:
                     logger.warning(f"Could not check position mode for fallback: {str(e)}, assuming one-way mode")
                     is_one_way_mode_fallback = True
                 
-                # Place TP and SL orders separately (like in place_order)
+                # Place TP and SL in a single batchOrders call - one round-trip
+                # instead of two sequential ones. The batch endpoint wants all
+                # values stringified, and per-order failures come back inline
+                # as {code, msg} entries instead of raising.
                 tp_order_id = None
                 sl_order_id = None
                 tp_success = False
                 sl_success = False
-                
-                # Place Take Profit order
+
+                fallback_side = dir_cfg['close_side']
+                tp_params = {
+                    'symbol': formatted_symbol,
+                    'side': fallback_side,
+                    'type': 'TAKE_PROFIT_MARKET',
+                    'stopPrice': str(take_profit_price),
+                    'closePosition': 'true'
+                }
+                sl_params = {
+                    'symbol': formatted_symbol,
+                    'side': fallback_side,
+                    'type': 'STOP_MARKET',
+                    'stopPrice': str(stop_loss_price),
+                    'closePosition': 'true'
+                }
+                if not is_one_way_mode_fallback:
+                    tp_params['positionSide'] = position_side
+                    sl_params['positionSide'] = position_side
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("📋 Fallback TP/SL batch parameters:")
+                    logger.info("   TP: %s", tp_params)
+                    logger.info("   SL: %s", sl_params)
+
                 try:
-                    tp_side = 'SELL' if direction == 'long' else 'BUY'
-                    tp_params = {
-                        'symbol': formatted_symbol,
-                        'side': tp_side,
-                        'type': 'TAKE_PROFIT_MARKET',
-                        'stopPrice': take_profit_price,
-                        'closePosition': True
-                    }
-                    
-                    if not is_one_way_mode_fallback:
-                        tp_params['positionSide'] = position_side
-                    
-                    logger.info(f"📋 Fallback Take Profit Parameters:")
-                    for key, value in tp_params.items():
-                        logger.info(f"   {key}: {value}")
-                    
-                    tp_order = self.client.futures_create_order(**tp_params)
-                    tp_order_id = tp_order.get('orderId')
+                    tp_result, sl_result = self.client.futures_place_batch_order(
+                        batchOrders=[tp_params, sl_params]
+                    )
+                except Exception as batch_error:
+                    logger.error("❌ Fallback TP/SL batch call failed: %s", str(batch_error))
+                    tp_result, sl_result = {}, {}
+
+                tp_order_id = tp_result.get('orderId')
+                if tp_order_id is not None:
                     tp_success = True
-                    logger.info(f"✅ Fallback take profit placed successfully!")
-                    logger.info(f"   Order ID: {tp_order_id}")
-                    logger.info(f"   Take Profit Price: ${take_profit_price:.2f}")
-                except Exception as tp_error:
-                    logger.error(f"❌ Failed to place fallback take profit: {str(tp_error)}")
-                    tp_success = False
-                
-                # Place Stop Loss order
-                try:
-                    sl_side = 'SELL' if direction == 'long' else 'BUY'
-                    sl_params = {
-                        'symbol': formatted_symbol,
-                        'side': sl_side,
-                        'type': 'STOP_MARKET',
-                        'stopPrice': stop_loss_price,
-                        'closePosition': True
-                    }
-                    
-                    if not is_one_way_mode_fallback:
-                        sl_params['positionSide'] = position_side
-                    
-                    logger.info(f"📋 Fallback Stop Loss Parameters:")
-                    for key, value in sl_params.items():
-                        logger.info(f"   {key}: {value}")
-                    
-                    sl_order = self.client.futures_create_order(**sl_params)
-                    sl_order_id = sl_order.get('orderId')
+                    logger.info("✅ Fallback take profit placed successfully!")
+                    logger.info("   Order ID: %s", tp_order_id)
+                    logger.info("   Take Profit Price: $%.2f", take_profit_price)
+                else:
+                    logger.error("❌ Failed to place fallback take profit: %s", tp_result.get('msg', 'Unknown error'))
+
+                sl_order_id = sl_result.get('orderId')
+                if sl_order_id is not None:
                     sl_success = True
-                    logger.info(f"✅ Fallback stop loss placed successfully!")
-                    logger.info(f"   Order ID: {sl_order_id}")
-                    logger.info(f"   Stop Price: ${stop_loss_price:.2f}")
-                except Exception as sl_error:
-                    logger.error(f"❌ Failed to place fallback stop loss: {str(sl_error)}")
-                    sl_success = False
-                
+                    logger.info("✅ Fallback stop loss placed successfully!")
+                    logger.info("   Order ID: %s", sl_order_id)
+                    logger.info("   Stop Price: $%.2f", stop_loss_price)
+                else:
+                    logger.error("❌ Failed to place fallback stop loss: %s", sl_result.get('msg', 'Unknown error'))
+
                 # Return result based on what was placed
                 if tp_success or sl_success:
                     message_parts = []
@@ -1437,10 +2555,9 @@ class BinanceHandler:
             # When price moves AGAINST (short: up), place fixed stop to limit loss.
             hard_stop_order_id = None
             try:
-                sl_side = 'SELL' if direction == 'long' else 'BUY'
                 sl_params = {
                     'symbol': formatted_symbol,
-                    'side': sl_side,
+                    'side': dir_cfg['close_side'],
                     'type': 'STOP_MARKET',
                     'stopPrice': stop_loss_price,
                     'closePosition': True
@@ -1448,19 +2565,19 @@ class BinanceHandler:
                 if not is_one_way_mode:
                     sl_params['positionSide'] = position_side
                 logger.info("📤 Placing parallel hard stop loss (adverse direction)...")
-                logger.info(f"   Stop Price: ${stop_loss_price:.2f}")
+                logger.info("   Stop Price: $%.2f", stop_loss_price)
                 sl_order = self.client.futures_create_order(**sl_params)
                 hard_stop_order_id = sl_order.get('orderId')
-                logger.info(f"✅ Hard stop loss placed: Order ID {hard_stop_order_id}")
+                logger.info("✅ Hard stop loss placed: Order ID %s", hard_stop_order_id)
             except Exception as sl_err:
-                logger.warning(f"⚠️ Parallel hard stop placement failed (trailing OK): {sl_err}")
+                logger.warning("⚠️ Parallel hard stop placement failed (trailing OK): %s", sl_err)
 
             # ====================================================================
             # STEP 10: SUCCESS RETURN
             # ====================================================================
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("✅ TRAILING STOP STRATEGY - SUCCESS")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             
             result = {
                 "success": True,
@@ -1477,9 +2594,7 @@ class BinanceHandler:
             return result
             
         except Exception as e:
-            logger.error(f"❌ Trailing stop strategy error: {str(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Trailing stop strategy error: %s", str(e))
             return {"success": False, "error": f"Trailing stop strategy failed: {str(e)}"}
     
     def cleanup_orphaned_trailing_stops(self):
@@ -1558,7 +2673,7 @@ class BinanceHandler:
                         try:
                             if hasattr(self.client, 'futures_cancel_algo_order'):
                                 self.client.futures_cancel_algo_order(symbol=symbol, algoId=algo_id)
-                                logger.info(f"🧹 Cleaned up orphaned trailing stop: {symbol} {algo_pos_side} (Algo ID: {algo_id})")
+                                logger.info("🧹 Cleaned up orphaned trailing stop: %s %s (Algo ID: %s)", symbol, algo_pos_side, algo_id)
                                 cancelled_count += 1
                                 
                                 # Remove from tracking
@@ -1569,7 +2684,7 @@ class BinanceHandler:
                             logger.warning(f"⚠️ Failed to cancel orphaned trailing stop {algo_id}: {str(e)}")
                 
                 if cancelled_count > 0:
-                    logger.info(f"✅ Cleaned up {cancelled_count} orphaned trailing stop(s)")
+                    logger.info("✅ Cleaned up %s orphaned trailing stop(s)", cancelled_count)
                     
             except Exception as e:
                 logger.warning(f"⚠️ Error cleaning up orphaned trailing stops: {str(e)}")
@@ -16,7 +16,11 @@ class CoinConfigManager:
     
     def __init__(self, config: Dict):
         self.config = config
-        
+
+        # Cache built configs per symbol - they only depend on self.config,
+        # which is fixed for the lifetime of this manager instance
+        self._coin_config_cache = {}
+
         # Default values for ANY coin
         self.defaults = {
             'order_size_percentage': 10.0,
@@ -87,8 +91,13 @@ class CoinConfigManager:
         Returns:
             Dict[str, Any]: Complete coin configuration
         """
+        cache_key = symbol.upper().strip()
+        cached = self._coin_config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         coin_type = self.extract_coin_type(symbol)
-        
+
         # Build coin config with fallbacks
         coin_config = {}
         
@@ -130,7 +139,8 @@ class CoinConfigManager:
         logger.info(f"   🛡️ SL Multiplier: {coin_config['atr_sl_multiplier']}x")
         logger.info(f"   📈 Trading Enabled: {coin_config['enable_trading']}")
         logger.info(f"   📦 Product Type: {coin_config['productType']}")
-        
+
+        self._coin_config_cache[cache_key] = coin_config
         return coin_config
     
     def validate_order_size_calculation(self, symbol: str, balance: float, 